@@ -19,6 +19,13 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+try:
+    # Optional faster parser for the (large) Atlas JSON files
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 ResidueSpec = Tuple[str, int, str]  # (nucleotide, residue_number, chain)
 
@@ -39,8 +46,8 @@ class AtlasMotifLoader:
 
     def _load_registry(self) -> Dict[str, Any]:
         try:
-            with open(self.registry_file, "r") as f:
-                return json.load(f)
+            with open(self.registry_file, "rb") as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             return {}
 
@@ -59,8 +66,8 @@ class AtlasMotifLoader:
                 continue
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                with open(file_path, "rb") as f:
+                    data = _json_loads(f.read())
             except Exception:
                 continue
 
@@ -162,6 +169,8 @@ class AtlasMotifLoader:
             return
 
         motifs: Iterable[Any] = data
+        index_setdefault = self.pdb_index.setdefault
+        extract_pdb_id = self._extract_pdb_id
 
         for motif_entry in motifs:
             if not isinstance(motif_entry, dict):
@@ -172,20 +181,22 @@ class AtlasMotifLoader:
                 # Not an Atlas motif entry; skip.
                 continue
 
-            for instance_id in alignment.keys():
-                pdb_id = self._extract_pdb_id(str(instance_id))
+            # Fields shared by every instance of this motif, read once
+            base = {
+                "motif_id": motif_entry.get("motif_id", "unknown"),
+                "motif_type": motif_type,
+                "num_instances": motif_entry.get("num_instances"),
+                "num_nucleotides": motif_entry.get("num_nucleotides"),
+            }
+
+            for instance_id in alignment:
+                pdb_id = extract_pdb_id(str(instance_id))
                 if not pdb_id:
                     continue
 
-                self.pdb_index.setdefault(pdb_id, []).append(
-                    {
-                        "motif_id": motif_entry.get("motif_id", "unknown"),
-                        "motif_type": motif_type,
-                        "instance_id": instance_id,
-                        "num_instances": motif_entry.get("num_instances"),
-                        "num_nucleotides": motif_entry.get("num_nucleotides"),
-                    }
-                )
+                entry = base.copy()
+                entry["instance_id"] = instance_id
+                index_setdefault(pdb_id, []).append(entry)
 
     @staticmethod
     def _extract_pdb_id(instance_id: str) -> Optional[str]:
@@ -220,8 +231,8 @@ class AtlasMotifLoader:
             return []
 
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = _json_loads(f.read())
         except Exception:
             return []
 
@@ -140,6 +140,46 @@ def get_color_name(motif_type):
     return PYMOL_COLOR_NAMES.get(normalized, 'gray')
 
 
+# Named colors already registered in PyMOL: color_name -> RGB
+_registered_colors = {}
+
+
+def register_color(cmd, color_name, color_rgb):
+    """
+    Define a named PyMOL color, skipping the call if it is already registered
+    with the same RGB.
+    
+    Args:
+        cmd: PyMOL cmd module
+        color_name (str): PyMOL color name
+        color_rgb (tuple): RGB color tuple (0-1 range)
+    
+    Returns:
+        str: The color name
+    """
+    color_rgb = tuple(color_rgb)
+    if _registered_colors.get(color_name) != color_rgb:
+        cmd.set_color(color_name, color_rgb)
+        _registered_colors[color_name] = color_rgb
+    return color_name
+
+
+def register_motif_color(cmd, motif_type):
+    """
+    Make sure the named PyMOL color for a motif type matches its current RGB.
+    
+    Args:
+        cmd: PyMOL cmd module
+        motif_type (str): Type of motif
+    
+    Returns:
+        str: PyMOL color name (e.g., 'motif_GNRA')
+    """
+    # Create custom color name, registering it only when new or changed
+    color_name = f'motif_{motif_type.replace("-", "_")}'
+    return register_color(cmd, color_name, get_color(motif_type))
+
+
 def set_motif_color_in_pymol(cmd, object_name, motif_type):
     """
     Set color for a PyMOL object based on motif type.
@@ -150,11 +190,7 @@ def set_motif_color_in_pymol(cmd, object_name, motif_type):
         motif_type (str): Type of motif
     """
     try:
-        color = get_color(motif_type)
-        # Create custom color name
-        color_name = f'motif_{motif_type.replace("-", "_")}'
-        cmd.set_color(color_name, color)
-        cmd.color(color_name, object_name)
+        cmd.color(register_motif_color(cmd, motif_type), object_name)
     except Exception as e:
         print(f"Warning: Could not set color for {object_name}: {e}")
 
@@ -270,7 +306,7 @@ def register_all_colors(cmd):
     for motif_type, color_rgb in MOTIF_COLORS.items():
         color_name = f'motif_{motif_type.replace("-", "_")}'
         try:
-            cmd.set_color(color_name, color_rgb)
+            register_color(cmd, color_name, color_rgb)
         except:
             pass
 
@@ -19,6 +19,7 @@ Version: 2.0.0
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -119,6 +120,12 @@ class MotifInstance:
     annotation: str = ''
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Memoized conversions (residues are not modified after construction)
+    _cached_legacy: Optional[List[Dict]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _cached_residue_tuples: Optional[List[Tuple[str, int, str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
     def get_chains(self) -> Set[str]:
         """Get all unique chains involved in this motif."""
         return set(r.chain for r in self.residues)
@@ -134,7 +141,11 @@ class MotifInstance:
         Convert to legacy format expected by MotifSelector.
         
         Returns list of dicts: [{motif_id, chain, residues}, ...]
+        The result is computed once and cached on the instance.
         """
+        if self._cached_legacy is not None:
+            return self._cached_legacy
+        
         by_chain: Dict[str, List[int]] = {}
         for r in self.residues:
             by_chain.setdefault(r.chain, []).append(r.residue_number)
@@ -146,7 +157,27 @@ class MotifInstance:
                 'chain': str(chain),
                 'residues': sorted(set(res_nums)),
             })
+        self._cached_legacy = result
         return result
+    
+    def residues_by_chain(self) -> Dict[str, array]:
+        """
+        Get sorted, unique residue numbers grouped by chain.
+        
+        Numbers are packed into array('i') (4 bytes each instead of a boxed
+        int per residue), since these are kept per instance for the session.
+        """
+        return {
+            entry['chain']: array('i', entry['residues'])
+            for entry in self.to_legacy_format()
+        }
+    
+    @property
+    def residue_tuples(self) -> List[Tuple[str, int, str]]:
+        """Residues in legacy tuple format (cached after first access)."""
+        if self._cached_residue_tuples is None:
+            self._cached_residue_tuples = [r.to_tuple() for r in self.residues]
+        return self._cached_residue_tuples
 
 
 @dataclass
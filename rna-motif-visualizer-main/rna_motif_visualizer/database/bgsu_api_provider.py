@@ -16,8 +16,6 @@ Version: 2.0.0
 from __future__ import annotations
 
 import re
-import ssl
-import urllib.request
 import urllib.error
 from typing import Dict, List, Optional, Set
 
@@ -29,6 +27,8 @@ from .base_provider import (
     MotifType,
     ResidueSpec,
 )
+from .config import get_config
+from .http_client import fetch_url
 
 
 class BGSUAPIProvider(BaseProvider):
@@ -51,9 +51,6 @@ class BGSUAPIProvider(BaseProvider):
     # Base URL for the BGSU RNA 3D Hub API
     API_BASE_URL = "https://rna.bgsu.edu/rna3dhub/loops/download"
     
-    # Timeout for API requests (seconds)
-    REQUEST_TIMEOUT = 30
-    
     # Mapping of loop type prefixes to full names
     MOTIF_TYPES = {
         'HL': 'Hairpin Loop',
@@ -190,27 +187,17 @@ class BGSUAPIProvider(BaseProvider):
         url = f"{self.API_BASE_URL}/{pdb_id}"
         
         try:
-            # Create request with proper headers
-            request = urllib.request.Request(
+            # Reuses a pooled keep-alive connection to the API host
+            status, data = fetch_url(
                 url,
-                headers={
-                    'User-Agent': 'RNA-Motif-Visualizer/2.0',
-                    'Accept': 'text/csv, text/plain, */*',
-                }
+                headers={'Accept': 'text/csv, text/plain, */*'},
+                timeout=get_config().request_timeout,
             )
-            
-            # Create SSL context that doesn't verify certificates
-            # This handles macOS certificate issues
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            with urllib.request.urlopen(request, timeout=self.REQUEST_TIMEOUT, context=ssl_context) as response:
-                if response.status == 200:
-                    return response.read().decode('utf-8')
-                else:
-                    print(f"BGSU API returned status {response.status} for {pdb_id}")
-                    return None
+            if status == 200:
+                return data.decode('utf-8')
+            else:
+                print(f"BGSU API returned status {status} for {pdb_id}")
+                return None
                     
         except urllib.error.HTTPError as e:
             if e.code == 404:
@@ -47,6 +47,7 @@ class PluginConfig:
         freshness_policy: Cache and freshness settings
         enable_api_fallback: Whether to try API if local fails
         request_timeout: Timeout for API requests (seconds)
+        all_sources_timeout: Time budget for querying every source in ALL mode (seconds)
         verbose: Enable verbose logging
     """
     
@@ -65,6 +66,7 @@ class PluginConfig:
     # API settings
     enable_api_fallback: bool = True
     request_timeout: int = 30
+    all_sources_timeout: int = 300
     
     # Display settings
     verbose: bool = False
@@ -112,6 +114,7 @@ class PluginConfig:
             'freshness_policy': self.freshness_policy.policy.value,
             'enable_api_fallback': self.enable_api_fallback,
             'request_timeout': self.request_timeout,
+            'all_sources_timeout': self.all_sources_timeout,
             'verbose': self.verbose,
         }
 
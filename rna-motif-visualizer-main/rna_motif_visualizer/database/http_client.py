@@ -0,0 +1,218 @@
+"""
+RNA Motif Visualizer - HTTP Client
+Shared keep-alive HTTP(S) fetching for the API providers.
+
+urllib.request opens (and TLS-handshakes) a new connection for every call.
+This module keeps a small process-wide pool of persistent http.client
+connections per host, so a session that loads many PDBs reuses sockets
+across requests and threads.
+
+Proxy settings from the environment (HTTP(S)_PROXY / NO_PROXY, or the system
+configuration via urllib.request.getproxies()) are honored the same way
+urllib.request.urlopen honors them.
+
+Errors are raised as urllib.error.HTTPError / urllib.error.URLError so
+callers keep their existing urllib error handling.
+
+Author: Structural Biology Lab
+Version: 2.0.0
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+# Default headers sent with every request
+DEFAULT_HEADERS = {
+    'User-Agent': 'RNA-Motif-Visualizer/2.0',
+}
+
+# Maximum number of redirects followed for a single request
+MAX_REDIRECTS = 5
+
+# Idle connections kept per (scheme, host, proxy); extras are closed
+MAX_IDLE_PER_HOST = 4
+
+# Create SSL context once that doesn't verify certificates
+# This handles macOS certificate issues
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Idle connections shared by all threads. A connection is checked out for
+# the duration of one request, so no two threads ever use it at once.
+_idle: Dict[Tuple[str, str, Optional[str]], List[http.client.HTTPConnection]] = {}
+_idle_lock = threading.Lock()
+
+# Errors that mean a kept-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[str]:
+    """Return the proxy URL to use for a host, or None for a direct connection."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if '://' not in proxy:
+        proxy = f"http://{proxy}"
+    return proxy
+
+
+def _proxy_auth_headers(proxy_parts) -> Dict[str, str]:
+    """Proxy-Authorization header for credentials embedded in the proxy URL."""
+    if not proxy_parts.username:
+        return {}
+    credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+    token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+    return {'Proxy-Authorization': f"Basic {token}"}
+
+
+def _new_connection(scheme: str, netloc: str, proxy: Optional[str],
+                    timeout: float) -> http.client.HTTPConnection:
+    """Open a connection to a host, directly or through a proxy."""
+    connection_class = (
+        http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+    )
+    kwargs = {'context': _SSL_CONTEXT} if scheme == 'https' else {}
+
+    if proxy is None:
+        return connection_class(netloc, timeout=timeout, **kwargs)
+
+    proxy_parts = urlsplit(proxy)
+    proxy_host = proxy_parts.hostname
+    proxy_port = proxy_parts.port
+    if scheme == 'https':
+        # CONNECT tunnel through the proxy; TLS is negotiated with the target
+        conn = connection_class(proxy_host, proxy_port, timeout=timeout, **kwargs)
+        conn.set_tunnel(netloc, headers=_proxy_auth_headers(proxy_parts))
+    else:
+        # Plain HTTP goes to the proxy with the absolute URL as request target
+        conn = connection_class(proxy_host, proxy_port, timeout=timeout)
+    return conn
+
+
+def _checkout(key: Tuple[str, str, Optional[str]], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+    """
+    Take an idle pooled connection for a key, or open a new one.
+
+    Returns:
+        (connection, True if it was reused from the pool)
+    """
+    with _idle_lock:
+        idle = _idle.get(key)
+        conn = idle.pop() if idle else None
+
+    if conn is None:
+        scheme, netloc, proxy = key
+        return _new_connection(scheme, netloc, proxy, timeout), False
+
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin(key: Tuple[str, str, Optional[str]], conn: http.client.HTTPConnection) -> None:
+    """Return a connection to the pool, closing it if the pool is full."""
+    with _idle_lock:
+        idle = _idle.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def fetch_url(url: str, headers: Optional[Dict[str, str]] = None,
+              timeout: float = 30) -> Tuple[int, bytes]:
+    """
+    GET a URL over a pooled keep-alive connection.
+
+    Redirects are followed; error statuses (>= 400) raise HTTPError.
+
+    Args:
+        url: Absolute http(s) URL
+        headers: Extra request headers (merged over DEFAULT_HEADERS)
+        timeout: Socket timeout in seconds
+
+    Returns:
+        (HTTP status, raw response body)
+
+    Raises:
+        urllib.error.HTTPError: Server returned an error status
+        urllib.error.URLError: Network failure
+    """
+    request_headers = dict(DEFAULT_HEADERS)
+    if headers:
+        request_headers.update(headers)
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        proxy = _proxy_for(parts.scheme, parts.hostname or '')
+        key = (parts.scheme, parts.netloc, proxy)
+
+        target = parts.path or '/'
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        send_headers = request_headers
+        if proxy is not None and parts.scheme == 'http':
+            target = url
+            send_headers = {**request_headers, **_proxy_auth_headers(urlsplit(proxy))}
+
+        # A reused connection may have been closed by the server while idle;
+        # retry once on a fresh connection in that case.
+        while True:
+            conn, reused = _checkout(key, timeout)
+            try:
+                conn.request('GET', target, headers=send_headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if not reused:
+                    raise urllib.error.URLError(e)
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise urllib.error.URLError(e)
+
+        if response.will_close:
+            conn.close()
+        else:
+            _checkin(key, conn)
+
+        if response.status in (301, 302, 303, 307, 308):
+            location = response.getheader('Location')
+            if location:
+                url = urljoin(url, location)
+                continue
+
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+
+        return response.status, body
+
+    raise urllib.error.URLError(f"Too many redirects for {url}")
+
+
+@atexit.register
+def close_all_connections() -> None:
+    """Close every idle pooled connection (registered to run at exit)."""
+    with _idle_lock:
+        for connections in _idle.values():
+            for conn in connections:
+                conn.close()
+        _idle.clear()
@@ -15,8 +15,6 @@ Version: 2.0.0
 from __future__ import annotations
 
 import json
-import ssl
-import urllib.request
 import urllib.error
 from typing import Dict, List, Optional, Set
 
@@ -28,6 +26,8 @@ from .base_provider import (
     MotifType,
     ResidueSpec,
 )
+from .config import get_config
+from .http_client import fetch_url
 
 
 class RfamAPIProvider(BaseProvider):
@@ -50,9 +50,6 @@ class RfamAPIProvider(BaseProvider):
     # Base URL for Rfam API
     API_BASE_URL = "https://rfam.org"
     
-    # Timeout for API requests (seconds)
-    REQUEST_TIMEOUT = 30
-    
     # Mapping of Rfam motif IDs to readable names
     # These are the main structural motifs in Rfam
     MOTIF_IDS = {
@@ -245,30 +242,21 @@ class RfamAPIProvider(BaseProvider):
         url = f"{self.API_BASE_URL}/motif/{rfam_motif_id}?content-type=application/json"
         
         try:
-            request = urllib.request.Request(
+            # Reuses a pooled keep-alive connection to the API host
+            status, data = fetch_url(
                 url,
-                headers={
-                    'User-Agent': 'RNA-Motif-Visualizer/2.0',
-                    'Accept': 'application/json',
-                }
+                headers={'Accept': 'application/json'},
+                timeout=get_config().request_timeout,
             )
-            
-            # Create SSL context that doesn't verify certificates
-            # This handles macOS certificate issues
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            with urllib.request.urlopen(request, timeout=self.REQUEST_TIMEOUT, context=ssl_context) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    
-                    # Parse the response to extract PDB mappings
-                    pdb_mappings = self._parse_rfam_motif_response(data)
-                    
-                    # Cache the result
-                    self._motif_pdb_cache[rfam_motif_id] = pdb_mappings
-                    return pdb_mappings
+            if status == 200:
+                data = json.loads(data.decode('utf-8'))
+                
+                # Parse the response to extract PDB mappings
+                pdb_mappings = self._parse_rfam_motif_response(data)
+                
+                # Cache the result
+                self._motif_pdb_cache[rfam_motif_id] = pdb_mappings
+                return pdb_mappings
                     
         except urllib.error.HTTPError as e:
             # 404 is expected for motifs not in Rfam - silently return empty
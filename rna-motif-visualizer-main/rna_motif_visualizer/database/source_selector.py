@@ -19,6 +19,8 @@ Version: 2.0.0
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, List, Optional, Set, Tuple
 
 from .base_provider import BaseProvider, MotifInstance
@@ -26,6 +28,24 @@ from .cache_manager import CacheManager, get_cache_manager
 from .config import get_config, FreshnessPolicy, SourceMode
 
 
+# Worker threads for ALL-mode queries, shared by every selector and load
+MAX_SOURCE_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the long-lived executor used to query sources concurrently."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_SOURCE_WORKERS, thread_name_prefix="rmv-source"
+            )
+        return _executor
+
+
 class SourceSelector:
     """
     Selects and combines motif data from multiple sources.
@@ -132,13 +152,34 @@ class SourceSelector:
         combined: Dict[str, List[MotifInstance]] = {}
         sources_used: List[str] = []
         
-        for source_id in source_ids:
-            if source_id not in self.providers:
+        source_ids = [sid for sid in source_ids if sid in self.providers]
+        if not source_ids:
+            self._last_source_used = None
+            return combined, ""
+        
+        # Query all providers concurrently; API providers are I/O bound so
+        # total latency is the slowest source rather than the sum of all.
+        # A provider may make several requests (Rfam queries each motif), so
+        # the batch gets its own budget rather than the per-request timeout.
+        # Each request is itself bounded by request_timeout, so a provider
+        # still running after the budget releases its worker soon after.
+        executor = _get_executor()
+        futures = {
+            source_id: executor.submit(self.providers[source_id].get_motifs_for_pdb, pdb_id)
+            for source_id in source_ids
+        }
+        wait(futures.values(), timeout=get_config().all_sources_timeout)
+        
+        # Merge in source order so results are deterministic
+        for source_id, future in futures.items():
+            if not future.done():
+                # Drop queued work so it does not hold the shared workers
+                future.cancel()
+                print(f"Timed out getting motifs from {source_id}")
                 continue
             
             try:
-                provider = self.providers[source_id]
-                motifs = provider.get_motifs_for_pdb(pdb_id)
+                motifs = future.result()
                 
                 if motifs:
                     sources_used.append(source_id)
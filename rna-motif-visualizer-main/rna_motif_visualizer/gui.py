@@ -13,7 +13,7 @@ Version: 2.0.0
 
 from pymol import cmd
 from .loader import VisualizationManager
-from .utils import get_logger
+from .utils import get_logger, SelectionParser
 from . import colors
 from .database import get_registry
 from pathlib import Path
@@ -98,6 +98,9 @@ class MotifVisualizerGUI:
             self.loaded_pdb = structure_name
             self.loaded_pdb_id = pdb_id.upper()
             
+            # A later rmv_load must not reuse the memo of an earlier one
+            self.viz_manager.forget_last_load()
+            
             # Load motif data directly from provider WITHOUT creating PyMOL objects
             pdb_id_upper = pdb_id.upper()
             
@@ -130,13 +133,12 @@ class MotifVisualizerGUI:
             
             # Process motifs for data access (WITHOUT creating PyMOL objects)
             motif_summary = {}
-            from .utils.parser import SelectionParser
             
             for motif_type, instances in available_motifs.items():
                 display_type = motif_type.split(':')[-1] if ':' in motif_type else motif_type
                 display_type_upper = display_type.upper()
                 
-                # Convert to motif details format (same as _load_motif_type does)
+                # Convert to motif details format (same as _prepare_motif_type does)
                 motif_details = []
                 motif_list = []
                 
@@ -145,7 +147,8 @@ class MotifVisualizerGUI:
                         motif_details.append({
                             'motif_id': instance.motif_id,
                             'instance_id': instance.instance_id,
-                            'residues': [r.to_tuple() for r in instance.residues],
+                            'residues': instance.residue_tuples,
+                            'chain_residues': instance.residues_by_chain(),
                             'annotation': instance.annotation,
                         })
                         
@@ -181,7 +184,7 @@ class MotifVisualizerGUI:
                     self.logger.success(f"Loaded {len(motif_details)} {display_type_upper} motifs")
             
             # Store in viz_manager's motif_loader for rmv_summary/rmv_show to access
-            self.viz_manager.motif_loader.loaded_motifs = motif_summary
+            self.viz_manager.motif_loader.loaded_motifs = dict(sorted(motif_summary.items()))
             
             if motif_summary:
                 self.logger.success(f"Loaded {len(motif_summary)} motif types from {pdb_id}")
@@ -234,7 +237,6 @@ class MotifVisualizerGUI:
             
             # Process motifs
             motif_summary = {}
-            from .utils.parser import SelectionParser
             
             for motif_type, instances in available_motifs.items():
                 display_type = motif_type.split(':')[-1] if ':' in motif_type else motif_type
@@ -248,7 +250,8 @@ class MotifVisualizerGUI:
                         motif_details.append({
                             'motif_id': instance.motif_id,
                             'instance_id': instance.instance_id,
-                            'residues': [r.to_tuple() for r in instance.residues],
+                            'residues': instance.residue_tuples,
+                            'chain_residues': instance.residues_by_chain(),
                             'annotation': instance.annotation,
                         })
                         
@@ -282,7 +285,7 @@ class MotifVisualizerGUI:
                     }
             
             # Store in viz_manager's motif_loader
-            self.viz_manager.motif_loader.loaded_motifs = motif_summary
+            self.viz_manager.motif_loader.loaded_motifs = dict(sorted(motif_summary.items()))
             
             total_count = sum(len(instances) for instances in available_motifs.values())
             self.logger.success(f"Found {total_count} motifs in {pdb_id} from {tool_name}")
@@ -351,7 +354,6 @@ class MotifVisualizerGUI:
             
             # Process motifs (same as fetch_motif_data_action)
             motif_summary = {}
-            from .utils.parser import SelectionParser
             
             total_count = sum(len(instances) for instances in available_motifs.values())
             self.logger.success(f"Found {total_count} motifs in {pdb_id} (source: {tool.upper()})")
@@ -454,7 +456,7 @@ class MotifVisualizerGUI:
                     self.logger.success(f"Loaded {len(motif_details)} {display_type_upper} motifs")
             
             # Store in viz_manager
-            self.viz_manager.motif_loader.loaded_motifs = motif_summary
+            self.viz_manager.motif_loader.loaded_motifs = dict(sorted(motif_summary.items()))
             
             if motif_summary:
                 self.logger.success(f"Loaded {len(motif_summary)} motif types from {tool.upper()}")
@@ -1373,6 +1375,13 @@ def initialize_gui():
         else:
             # Case 2: Everything in motif_type as a single string
             full_arg = str(motif_type).strip()
+            
+            # A single word can never carry the on/off flag
+            if ' ' not in full_arg:
+                gui.logger.error(f"Usage: rmv_toggle MOTIF_TYPE on/off")
+                gui.logger.error(f"Example: rmv_toggle HL on")
+                return
+            
             parts = full_arg.split()
             
             if len(parts) < 2:
@@ -1389,18 +1398,6 @@ def initialize_gui():
         
         gui.toggle_motif_action(motif_arg, visible_bool)
     
-    def motif_status():
-        """PyMOL command: Show plugin status."""
-        gui.print_status()
-    
-    def list_sources():
-        """PyMOL command: Show available data sources."""
-        gui.print_sources()
-    
-    def show_help():
-        """PyMOL command: Show all available commands."""
-        gui.print_help()
-    
     def set_bg_color(color_name='gray80'):
         """PyMOL command: Change background color of non-motif residues."""
         color_arg = str(color_name).strip()
@@ -1423,6 +1420,11 @@ def initialize_gui():
             # Check if instance number is provided
             motif_arg = str(motif_type).strip().upper()
             
+            # Fast path: a single word is always just a motif type
+            if ' ' not in motif_arg and not instance_no:
+                gui.show_motif_summary_for_type(motif_arg)
+                return
+            
             # Handle both formats: "HL 1" and separate args
             if instance_no:
                 try:
@@ -1432,9 +1434,10 @@ def initialize_gui():
                     gui.logger.error("Instance number must be an integer")
             else:
                 # Check if the motif_type contains instance number
-                parts = motif_arg.split()
-                if len(parts) == 2 and parts[1].isdigit():
-                    gui.show_motif_instance_summary(parts[0], int(parts[1]))
+                head, sep, tail = motif_arg.partition(' ')
+                tail = tail.lstrip()
+                if sep and tail.isdigit():
+                    gui.show_motif_instance_summary(head, int(tail))
                 else:
                     # Show all instances of the motif type
                     gui.show_motif_summary_for_type(motif_arg)
@@ -1462,8 +1465,8 @@ def initialize_gui():
         tool_arg = str(tool).strip().lower() if tool else None
         
         # Handle PyMOL passing arguments as combined string: "local atlas" or "web bgsu"
-        parts = mode_arg.split()
-        if len(parts) > 1:
+        if ' ' in mode_arg:
+            parts = mode_arg.split()
             mode_arg = parts[0]
             if not tool_arg:
                 tool_arg = parts[1].lower()
@@ -1506,6 +1509,11 @@ def initialize_gui():
         
         motif_arg = str(motif_type).strip().upper()
         
+        # Fast path: a single word is always just a motif type
+        if ' ' not in motif_arg and not instance_no:
+            gui.viz_manager.show_motif_type(motif_arg)
+            return
+        
         # Handle both formats: "HL 1" and separate args
         if instance_no:
             try:
@@ -1515,9 +1523,10 @@ def initialize_gui():
                 gui.logger.error("Instance number must be an integer")
         else:
             # Check if the motif_type contains instance number
-            parts = motif_arg.split()
-            if len(parts) == 2 and parts[1].isdigit():
-                gui.viz_manager.show_motif_instance(parts[0], int(parts[1]))
+            head, sep, tail = motif_arg.partition(' ')
+            tail = tail.lstrip()
+            if sep and tail.isdigit():
+                gui.viz_manager.show_motif_instance(head, int(tail))
             else:
                 # Show all instances of the motif type
                 gui.viz_manager.show_motif_type(motif_arg)
@@ -1540,26 +1549,24 @@ def initialize_gui():
         else:
             # Parse combined string
             full_arg = str(motif_type).strip()
-            parts = full_arg.split()
             
-            if len(parts) < 2:
+            # A single word can never carry the instance number
+            if ' ' not in full_arg:
                 gui.logger.error("Usage: rmv_instance <MOTIF_TYPE> <NO>")
                 gui.logger.error("Example: rmv_instance GNRA 1")
                 return
             
-            motif_arg = parts[0].upper()
+            head, _, tail = full_arg.partition(' ')
+            
+            motif_arg = head.upper()
             try:
-                no_arg = int(parts[1])
+                no_arg = int(tail)
             except ValueError:
                 gui.logger.error("Instance number must be an integer")
                 return
         
         gui.viz_manager.show_motif_instance(motif_arg, no_arg)
     
-    def show_all():
-        """PyMOL command: Show all motifs (reset to default view)."""
-        gui.viz_manager.show_all_motifs()
-    
     def load_user_annotations(tool='', pdb_id=''):
         """
         PyMOL command: Load motifs from user-uploaded annotation files.
@@ -1614,20 +1621,21 @@ def initialize_gui():
         gui.load_user_annotations_action(tool_arg, pdb_arg)
     
     # Add commands to PyMOL
+    # Commands that take no arguments are registered as bound methods directly
     cmd.extend('rmv_fetch', fetch_raw_pdb)
     cmd.extend('rmv_load', load_structure)
     cmd.extend('rmv_switch', switch_database)
     cmd.extend('rmv_toggle', toggle_motif)
-    cmd.extend('rmv_status', motif_status)
-    cmd.extend('rmv_sources', list_sources)
-    cmd.extend('rmv_help', show_help)
+    cmd.extend('rmv_status', gui.print_status)
+    cmd.extend('rmv_sources', gui.print_sources)
+    cmd.extend('rmv_help', gui.print_help)
     cmd.extend('rmv_bg_color', set_bg_color)
     cmd.extend('rmv_summary', motif_summary)
     cmd.extend('rmv_source', set_source)
     cmd.extend('rmv_refresh', refresh_motifs)
     cmd.extend('rmv_show', show_motif)
     cmd.extend('rmv_instance', show_instance)
-    cmd.extend('rmv_all', show_all)
+    cmd.extend('rmv_all', gui.viz_manager.show_all_motifs)
     cmd.extend('rmv_user', load_user_annotations)
     
     def show_colors():
@@ -1682,7 +1690,7 @@ def initialize_gui():
         if motif_arg in loaded_motifs:
             info = loaded_motifs[motif_arg]
             structure_name = info.get('structure_name')
-            main_selection = info.get('main_selection')
+            main_selection = gui.viz_manager.motif_loader.get_main_selection(motif_arg)
             
             # Re-color the motif residues in the structure
             if main_selection:
@@ -14,21 +14,94 @@ Author: CBB Lab by Dr.Zhong
 Version: 2.0.0
 """
 
+import io
 import os
+import re
+import sys
+import traceback
+from array import array
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .utils import (
     PDBParser,
     MotifSelector,
+    MotifSoA,
+    SelectionParser,
+    cached_selection_string,
     get_logger,
 )
 from . import colors
 from .database import (
     get_registry,
+    get_config,
+    get_source_selector,
     MotifInstance,
 )
 
+# Maps separators in user-typed motif types to the '_' used in loaded_motifs keys
+_NORMALIZE_TABLE = str.maketrans({'-': '_', ' ': '_'})
+
+# Rules for console tables
+_HDR = "=" * 50
+_SEP = "-" * 50
+_HDR_WIDE = "=" * 70
+_SEP_WIDE = "-" * 70
+
+
+@lru_cache(maxsize=32)
+def _instance_object_pattern(motif_types: Tuple[str, ...]):
+    """Compiled regex matching per-instance object names (e.g. GNRA_3) for these types."""
+    alternatives = '|'.join(map(re.escape, motif_types))
+    return re.compile(rf'(?:{alternatives})_\d+')
+
+
+def _summarize_instance(detail: Dict, chain_residues: Dict) -> Dict[str, str]:
+    """
+    Build the instance-table columns for one motif instance.
+    
+    Args:
+        detail: Motif instance detail dict (uses its 'residues' tuples)
+        chain_residues: Chain -> sorted residue numbers for the instance
+        
+    Returns:
+        Dict with 'chains' ("A, B"), 'range_str' ("A:1-5, B:7-9") and
+        'nucs_preview' (first 20 nucleotides, grouped by chain)
+    """
+    sorted_chains = sorted(chain_residues)
+    
+    # Nucleotides, grouped by chain in residue order
+    nucs_by_chain: Dict[str, List[str]] = {}
+    for res in detail.get('residues', []):
+        if isinstance(res, tuple) and len(res) >= 3 and res[0]:
+            nucs_by_chain.setdefault(res[2], []).append(res[0])
+    all_nucs = [nuc for chain in sorted_chains for nuc in nucs_by_chain.get(chain, ())]
+    nucs_preview = ''.join(all_nucs[:20])
+    if len(all_nucs) > 20:
+        nucs_preview += '...'
+    
+    return {
+        'chains': ', '.join(sorted_chains),
+        'range_str': ', '.join(
+            f"{chain}:{chain_residues[chain][0]}-{chain_residues[chain][-1]}"
+            for chain in sorted_chains
+            if chain_residues[chain]
+        ),
+        'nucs_preview': nucs_preview,
+    }
+
+
+# Global cartoon settings shared by structures and motif objects
+_CARTOON_DEFAULTS = (
+    ('cartoon_nucleic_acid_mode', 4),  # Simple tube mode
+    ('cartoon_tube_radius', 0.4),
+)
+
+# Row formatters for the instance tables (format strings parsed once)
+_INSTANCE_ROW_FMT = "  {:<6} {:<10} {:<25} {:<25}\n".format
+_RESIDUE_ROW_FMT = "  {:<8} {:<8} {:<12}\n".format
+
 
 class StructureLoader:
     """Handles loading RNA structures into PyMOL."""
@@ -125,6 +198,15 @@ class UnifiedMotifLoader:
         
         # Get registry
         self._registry = get_registry()
+        
+        # Motif objects inherit these instead of setting them per object
+        self.apply_cartoon_defaults()
+    
+    def apply_cartoon_defaults(self) -> None:
+        """Set the global cartoon settings used for structures and motif objects."""
+        set_setting = self.cmd.set
+        for name, value in _CARTOON_DEFAULTS:
+            set_setting(name, value)
     
     def load_motifs(self, structure_name: str, pdb_id: str,
                    provider_id: Optional[str] = None,
@@ -148,7 +230,6 @@ class UnifiedMotifLoader:
             pdb_id = pdb_id.upper()
             
             # Try to use source selector for smart source selection
-            from .database import get_source_selector
             source_selector = get_source_selector()
             
             if source_selector and not provider_id:
@@ -183,46 +264,55 @@ class UnifiedMotifLoader:
             total_count = sum(len(instances) for instances in available_motifs.values())
             self.logger.info(f"Found {total_count} motifs in {pdb_id} (source: {source_name})")
             
-            # Process each motif type
+            # Prepare each motif type (pure Python, no PyMOL calls)
+            prepared = []
             for motif_type, instances in available_motifs.items():
                 try:
                     # Handle prefixed motif types from combined sources (e.g., "bgsu_api:HL")
                     display_type = motif_type.split(':')[-1] if ':' in motif_type else motif_type
-                    self._load_motif_type(structure_name, pdb_id, display_type, instances)
+                    result = self._prepare_motif_type(structure_name, pdb_id, display_type, instances)
+                    if result:
+                        prepared.append(result)
                 except Exception as e:
                     self.logger.error(f"Error loading {motif_type} motifs: {e}")
                     continue
             
+            # Record the prepared types in sorted order, so consumers of
+            # loaded_motifs can rely on insertion order instead of re-sorting
+            prepared.sort(key=lambda item: item[0])
+            for motif_type_upper, info in prepared:
+                self._apply_motif_type(motif_type_upper, info)
+            
             return self.loaded_motifs
             
         except Exception as e:
-            self.logger.error(f"Failed to load motifs: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.error(f"Failed to load motifs: {e}\n{traceback.format_exc()}")
             return {}
     
     def get_last_source_used(self) -> Optional[str]:
         """Get the data source used for the last load operation."""
         return self._last_source_used
     
-    def _load_motif_type(self, structure_name: str, pdb_id: str,
-                        motif_type: str, instances: List,
-                        use_direct_coloring: bool = True) -> None:
+    def _prepare_motif_type(self, structure_name: str, pdb_id: str,
+                            motif_type: str, instances: List) -> Optional[Tuple[str, Dict]]:
         """
-        Load a specific motif type and visualize in PyMOL.
+        Build the loaded_motifs entry for one motif type without touching PyMOL.
         
-        Creates PyMOL objects (visible in right panel) AND colors residues
-        directly on the structure (to avoid z-fighting stripes).
+        Collects the residues and combined selection for the type; the PyMOL
+        object is only created by ensure_object() when the type is first
+        toggled on or shown.
         
         Args:
             structure_name: PyMOL structure name
             pdb_id: PDB ID
             motif_type: Type of motif (HL, IL, GNRA, etc.)
             instances: List of MotifInstance objects
-            use_direct_coloring: If True, also color residues directly on structure
+        
+        Returns:
+            (normalized motif type, info dict), or None if there are no residues
         """
         if not instances:
-            return
+            return None
         
         # Build motif_list in format MotifSelector expects
         motif_list: List[Dict] = []
@@ -236,70 +326,136 @@ class UnifiedMotifLoader:
             legacy_entries = instance.to_legacy_format()
             motif_list.extend(legacy_entries)
             
-            motif_details.append({
+            detail = {
                 'motif_id': instance.motif_id,
                 'instance_id': instance.instance_id,
-                'residues': [r.to_tuple() for r in instance.residues],
+                'residues': instance.residue_tuples,
+                'chain_residues': instance.residues_by_chain(),
                 'annotation': instance.annotation,
-            })
+            }
+            # Table columns never change for loaded data, so compute them once here
+            detail['_summary'] = _summarize_instance(detail, detail['chain_residues'])
+            motif_details.append(detail)
         
         if not motif_list:
             self.logger.debug(f"No residues found for {motif_type} motifs in {pdb_id}")
-            return
+            return None
         
         motif_type_upper = motif_type.upper()
         color_rgb = colors.get_color(motif_type_upper)
         
-        # STEP 1: Hide motif residues on the MAIN structure to prevent z-fighting
-        # Build combined selection for all residues of this motif type
-        from .utils.parser import SelectionParser
-        all_selections = []
-        for motif in motif_list:
-            chain = motif.get('chain')
-            residues = motif.get('residues')
-            sel = SelectionParser.create_selection_string(chain, residues)
-            if sel:
-                all_selections.append(f"({sel})")
-        
-        if all_selections:
-            combined_sel = " or ".join(all_selections)
+        # Build combined selection for all residues of this motif type. The
+        # PyMOL object itself is created lazily by ensure_object(). Residues
+        # shared by overlapping motifs are merged per chain first; the
+        # flattened form is kept so the object reuses the same merge.
+        motif_soa = MotifSoA.from_motif_list(motif_list)
+        combined_sel = SelectionParser.create_multichain_selection(motif_soa.chain_residues())
+        
+        main_motif_sel = None
+        if combined_sel:
             main_motif_sel = f"({structure_name}) and ({combined_sel})"
-            # Hide the cartoon on main structure for these residues
-            self.cmd.hide('cartoon', main_motif_sel)
         
-        # STEP 2: Create PyMOL object (visible in right panel)
+        return motif_type_upper, {
+            'object_name': None,  # Created on first toggle/show
+            'structure_name': structure_name,
+            'count': len(instances),
+            'visible': False,
+            'motifs': motif_list,
+            'motif_soa': motif_soa,
+            'motif_details': motif_details,
+            'color_rgb': color_rgb,
+            'main_selection': main_motif_sel,
+            'instance_objects': [],  # Per-instance objects (e.g. GNRA_1), created on demand
+        }
+    
+    def _apply_motif_type(self, motif_type_upper: str, info: Dict) -> None:
+        """
+        Register a prepared motif type in loaded_motifs.
+        
+        Args:
+            motif_type_upper: Normalized motif type
+            info: Entry built by _prepare_motif_type()
+        """
+        self.loaded_motifs[motif_type_upper] = info
+        self.logger.success(f"Loaded {info['count']} {motif_type_upper} motifs")
+    
+    def get_main_selection(self, motif_type: str) -> Optional[str]:
+        """
+        Get the named PyMOL selection covering a motif type on the main structure.
+        
+        The selection (_rmv_<TYPE>_sel) is created on first use so PyMOL
+        parses the combined residue selection only once; later hide/show/color
+        calls refer to it by name.
+        
+        Args:
+            motif_type (str): Normalized motif type (e.g., 'HL', 'GNRA')
+        
+        Returns:
+            str: Selection name, or None if the type has no residues
+        """
+        info = self.loaded_motifs.get(motif_type)
+        if not info:
+            return None
+        
+        sel_name = info.get('main_selection_name')
+        if sel_name:
+            return sel_name
+        
+        main_selection = info.get('main_selection')
+        if not main_selection:
+            return None
+        
+        sel_name = f"_rmv_{motif_type}_sel"
+        self.cmd.select(sel_name, main_selection, enable=0)
+        info['main_selection_name'] = sel_name
+        return sel_name
+    
+    def ensure_object(self, motif_type: str) -> Optional[str]:
+        """
+        Create the PyMOL object for a loaded motif type if it doesn't exist yet.
+        
+        Args:
+            motif_type (str): Normalized motif type (e.g., 'HL', 'GNRA')
+        
+        Returns:
+            str: Object name, or None if it could not be created
+        """
+        info = self.loaded_motifs.get(motif_type)
+        if not info:
+            return None
+        
+        obj_name = info.get('object_name')
+        if obj_name:
+            return obj_name
+        
+        structure_name = info.get('structure_name')
+        motif_list = info.get('motifs', [])
+        if not structure_name or not motif_list:
+            return None
+        
+        # Hide motif residues on the MAIN structure to prevent z-fighting
+        main_selection = self.get_main_selection(motif_type)
+        if main_selection:
+            self.cmd.hide('cartoon', main_selection)
+        
+        # Create PyMOL object (visible in right panel)
         obj_name = self.selector.create_motif_class_object(
             structure_name,
-            motif_type_upper,
-            motif_list,
+            motif_type,
+            info.get('motif_soa') or motif_list,
         )
         
         if obj_name:
             # Show cartoon on the motif object
             self.cmd.show('cartoon', obj_name)
             
-            # Apply consistent representation settings for uniform appearance
-            self.cmd.set('cartoon_nucleic_acid_mode', 4, obj_name)  # Simple tube mode
-            self.cmd.set('cartoon_tube_radius', 0.4, obj_name)
-            
             # Color the object with the motif color
-            colors.set_motif_color_in_pymol(self.cmd, obj_name, motif_type_upper)
-            
-            # Object stays ENABLED (visible in panel and on screen)
-            # No z-fighting because main structure doesn't render these residues
-            
-            self.loaded_motifs[motif_type_upper] = {
-                'object_name': obj_name,
-                'structure_name': structure_name,
-                'count': len(instances),
-                'visible': True,
-                'motifs': motif_list,
-                'motif_details': motif_details,
-                'color_rgb': color_rgb,
-                'main_selection': main_motif_sel if all_selections else None,
-            }
+            colors.set_motif_color_in_pymol(self.cmd, obj_name, motif_type)
             
-            self.logger.success(f"Loaded {len(instances)} {motif_type_upper} motifs")
+            info['object_name'] = obj_name
+            self.logger.debug(f"Created PyMOL object: {obj_name}")
+        
+        return obj_name
     
     def toggle_motif_type(self, motif_type: str, visible: bool) -> bool:
         """
@@ -314,23 +470,27 @@ class UnifiedMotifLoader:
         Returns:
             bool: True if successful
         """
-        motif_type = str(motif_type).upper().strip()
-        motif_type = motif_type.replace('-', '_').replace(' ', '_')
+        motif_type = str(motif_type).strip().upper().translate(_NORMALIZE_TABLE)
         
         if motif_type not in self.loaded_motifs:
             self.logger.warning(f"Motif type {motif_type} not loaded")
             return False
         
         info = self.loaded_motifs[motif_type]
-        obj_name = info['object_name']
         
         if visible:
-            # Show the motif object
+            # Show the motif object, creating it on first use
+            obj_name = self.ensure_object(motif_type)
+            if not obj_name:
+                self.logger.error(f"Could not create object for {motif_type}")
+                return False
             self.cmd.enable(obj_name)
             self.cmd.show('cartoon', obj_name)
         else:
-            # Hide the motif object
-            self.cmd.disable(obj_name)
+            # Hide the motif object (nothing to do if never created)
+            obj_name = info.get('object_name')
+            if obj_name:
+                self.cmd.disable(obj_name)
         
         self.loaded_motifs[motif_type]['visible'] = visible
         return True
@@ -343,15 +503,21 @@ class UnifiedMotifLoader:
         """Clear all loaded motif objects from PyMOL."""
         try:
             for motif_type, info in self.loaded_motifs.items():
-                obj_name = info['object_name']
+                obj_names = list(info.get('instance_objects', ()))
+                if info.get('object_name'):
+                    obj_names.append(info['object_name'])
+                if info.get('main_selection_name'):
+                    obj_names.append(info['main_selection_name'])
                 
-                # Delete the object
-                try:
-                    self.cmd.delete(obj_name)
-                except:
-                    pass
+                # Delete the motif type object, instance objects and named selection
+                for obj_name in obj_names:
+                    try:
+                        self.cmd.delete(obj_name)
+                    except:
+                        pass
             
             self.loaded_motifs = {}
+            cached_selection_string.cache_clear()
             self.logger.info("Cleared all motif objects")
         except Exception as e:
             self.logger.error(f"Failed to clear motifs: {e}")
@@ -393,6 +559,13 @@ class UnifiedMotifLoader:
         return self._registry
 
 
+# Instances colored per combined PyMOL call in show_motif_type
+COLOR_CHUNK_SIZE = 32
+
+# Longest selection string passed to PyMOL in a single call
+MAX_SELECTION_LENGTH = 8000
+
+
 class VisualizationManager:
     """High-level manager for the entire visualization workflow."""
     
@@ -410,6 +583,16 @@ class VisualizationManager:
         self.motif_loader = UnifiedMotifLoader(cmd, database_dir)
         self.logger = get_logger()
         self._current_provider_id = None
+        
+        # Set False to skip console summary tables and follow-up hints (batch/scripted use)
+        self.verbose = True
+        
+        # Arguments and result of the last load_and_visualize call (session memo)
+        self._last_call: Optional[Tuple[str, Optional[str], Optional[str], str]] = None
+        self._last_result: Dict = {}
+        
+        # Motif type -> registered PyMOL color name
+        self._motif_color: Dict[str, str] = {}
     
     def setup_clean_visualization(self, structure_name: str,
                                  background_color: Optional[str] = None) -> None:
@@ -443,8 +626,7 @@ class VisualizationManager:
             self.cmd.show('cartoon', rna_selection)
             
             # Set consistent cartoon nucleic acid settings for uniform appearance
-            self.cmd.set('cartoon_nucleic_acid_mode', 4)  # Simple tube mode
-            self.cmd.set('cartoon_tube_radius', 0.4)
+            self.motif_loader.apply_cartoon_defaults()
             
             # Color uniformly
             self.cmd.color(background_color, rna_selection)
@@ -470,6 +652,21 @@ class VisualizationManager:
         Returns:
             dict: Loaded motifs, or empty dict if failed
         """
+        # Re-running the same load while its structure and motifs are still
+        # current only resets the view; skip the fetch and motif lookup
+        key = (pdb_id_or_path, provider_id, background_color, get_config().source_mode.value)
+        structure_name = self.structure_loader.get_current_structure()
+        if (key == self._last_call and self._last_result
+                and self._last_result is self.motif_loader.get_loaded_motifs()
+                and structure_name in self.cmd.get_names()):
+            self.setup_clean_visualization(structure_name, background_color)
+            for info in self._last_result.values():
+                info['visible'] = False
+            self._print_motif_summary_table(
+                self.structure_loader.get_current_pdb_id(), self._last_result, provider_id
+            )
+            return self._last_result
+        
         # Load structure
         structure_name = self.structure_loader.load_structure(pdb_id_or_path)
         if not structure_name:
@@ -486,12 +683,25 @@ class VisualizationManager:
         if provider_id:
             self._current_provider_id = provider_id
         
+        self._last_call = key
+        self._last_result = motifs
+        
         # Print detailed summary table to PyMOL console
         if motifs:
             self._print_motif_summary_table(pdb_id, motifs, provider_id)
         
         return motifs
     
+    def forget_last_load(self) -> None:
+        """Drop the load_and_visualize memo so the next call loads afresh."""
+        self._last_call = None
+        self._last_result = {}
+    
+    def clear_motifs(self) -> None:
+        """Clear all loaded motif objects and the load memo."""
+        self.motif_loader.clear_motifs()
+        self.forget_last_load()
+    
     def switch_database(self, provider_id: str) -> bool:
         """
         Switch to a different database provider.
@@ -529,7 +739,7 @@ class VisualizationManager:
             return {}
         
         # Clear existing motifs
-        self.motif_loader.clear_motifs()
+        self.clear_motifs()
         
         # Set up visualization again
         self.setup_clean_visualization(structure_name, background_color)
@@ -584,6 +794,9 @@ class VisualizationManager:
             motifs: Dictionary of loaded motifs
             provider_id: Database provider used
         """
+        if not self.verbose:
+            return
+        
         # Get database name from the last source used
         last_source = self.motif_loader.get_last_source_used()
         
@@ -612,31 +825,31 @@ class VisualizationManager:
             db_name = provider.info.name if provider else "Unknown"
         
         # Build the table
-        print("\n" + "=" * 50)
+        print("\n" + _HDR)
         print(f"  MOTIF SUMMARY - {pdb_id}")
-        print("=" * 50)
+        print(_HDR)
         print(f"  Database: {db_name}")
-        print("-" * 50)
+        print(_SEP)
         
         # Header
         print(f"  {'MOTIF TYPE':<20} {'INSTANCES':>12}")
-        print("-" * 50)
+        print(_SEP)
         
         total_motifs = 0
         
-        for motif_type, info in sorted(motifs.items()):
+        for motif_type, info in motifs.items():
             count = info.get('count', 0)
             total_motifs += count
             print(f"  {motif_type:<20} {count:>12}")
         
-        print("-" * 50)
+        print(_SEP)
         print(f"  {'TOTAL':<20} {total_motifs:>12}")
-        print("=" * 50)
+        print(_HDR)
         print("\n  Next steps:")
         if total_motifs > 0:
             # Find the first motif type to suggest
             first_motif = None
-            for motif_type in sorted(motifs.keys()):
+            for motif_type in motifs:
                 if motifs[motif_type].get('count', 0) > 0:
                     first_motif = motif_type
                     break
@@ -644,7 +857,126 @@ class VisualizationManager:
                 print(f"    rmv_show {first_motif:<20}  Highlight & view {first_motif} instances")
             print(f"    rmv_summary              Display this summary again")
             print(f"    rmv_all                  Show all motifs (default view)")
-        print("=" * 50 + "\n")
+        print(_HDR + "\n")
+    
+    def _build_instance_selection(self, detail: Dict) -> Tuple[Optional[str], Dict[str, array], str]:
+        """
+        Build (and cache on the detail) the selection data for one motif instance.
+        
+        Args:
+            detail: Motif instance detail dict (from loaded_motifs['motif_details'])
+            
+        Returns:
+            Tuple of (selection without structure prefix or None,
+            chain -> sorted residue numbers, "A:1-5, B:7-9" range string)
+        """
+        cached = detail.get('_sel_cache')
+        if cached is not None:
+            return cached
+        
+        # Chain -> sorted residues, precomputed at load time when available
+        chain_residues = detail.get('chain_residues')
+        if chain_residues is None:
+            chain_residues = {}
+            for res in detail.get('residues', []):
+                if isinstance(res, tuple) and len(res) >= 3:
+                    resi, chain = res[1], res[2]
+                    if chain not in chain_residues:
+                        chain_residues[chain] = array('i')
+                    chain_residues[chain].append(resi)
+            for chain, resi_array in chain_residues.items():
+                chain_residues[chain] = array('i', sorted(resi_array))
+        
+        combined_sel = SelectionParser.create_multichain_selection(chain_residues)
+        
+        summary = detail.get('_summary')
+        if summary is None:
+            summary = _summarize_instance(detail, chain_residues)
+            detail['_summary'] = summary
+        
+        cached = (combined_sel, chain_residues, summary['range_str'])
+        detail['_sel_cache'] = cached
+        return cached
+    
+    def _color_motif(self, selection: str, motif_type: str) -> None:
+        """
+        Color a selection with a motif type's color.
+        
+        The PyMOL color name is registered once per motif type and then
+        applied with a plain cmd.color call. Custom colors (rmv_color) update
+        the same named color, so the cached name stays valid.
+        
+        Args:
+            selection (str): PyMOL selection or object name
+            motif_type (str): Motif type whose color is applied
+        """
+        try:
+            color_name = self._motif_color.get(motif_type)
+            if color_name is None:
+                color_name = colors.register_motif_color(self.cmd, motif_type)
+                self._motif_color[motif_type] = color_name
+            self.cmd.color(color_name, selection)
+        except Exception as e:
+            print(f"Warning: Could not set color for {selection}: {e}")
+    
+    def _hide_motif_objects(self, loaded_motifs: Dict) -> set:
+        """
+        Disable all motif class objects and per-instance objects (e.g. GNRA_3).
+        
+        Names are collected first and disabled with a single cmd.disable call.
+        
+        Args:
+            loaded_motifs (dict): Loaded motif info keyed by motif type
+            
+        Returns:
+            set: Object names from the single cmd.get_object_list() call
+        """
+        existing = set(self.cmd.get_object_list() or [])
+        if not loaded_motifs:
+            return existing
+        
+        names = [
+            info['object_name'] for info in loaded_motifs.values()
+            if info.get('object_name') in existing
+        ]
+        match = _instance_object_pattern(tuple(loaded_motifs)).fullmatch
+        names.extend(obj for obj in existing if match(obj))
+        if names:
+            self.cmd.disable(' '.join(names))
+        return existing
+    
+    def _color_selections_chunked(self, structure_name: str,
+                                  instance_sels: List[str], motif_type: str,
+                                  show_cartoon: bool = False) -> None:
+        """
+        Color many instance selections with a few combined PyMOL calls.
+        
+        Selections are joined COLOR_CHUNK_SIZE at a time; if a combined
+        string would exceed MAX_SELECTION_LENGTH, the chunk size is halved
+        until it fits (down to a single instance per call).
+        
+        Args:
+            structure_name (str): Name of the structure object in PyMOL
+            instance_sels (list): Parenthesised per-instance (or per-chain) selections
+            motif_type (str): Motif type whose color is applied
+            show_cartoon (bool): Also show cartoon for each combined selection
+        """
+        chunk_size = COLOR_CHUNK_SIZE
+        start = 0
+        while start < len(instance_sels):
+            chunk = instance_sels[start:start + chunk_size]
+            # A lone selection is already parenthesised; only a list needs grouping
+            if len(chunk) == 1:
+                big_sel = f"({structure_name}) and {chunk[0]}"
+            else:
+                big_sel = f"({structure_name}) and (" + " or ".join(chunk) + ")"
+            if len(big_sel) > MAX_SELECTION_LENGTH and chunk_size > 1:
+                chunk_size //= 2
+                continue
+            if show_cartoon:
+                self.cmd.show('cartoon', big_sel)
+            self._color_motif(big_sel, motif_type)
+            start += len(chunk)
     
     def show_motif_type(self, motif_type: str) -> bool:
         """
@@ -675,47 +1007,21 @@ class VisualizationManager:
         info = loaded_motifs[motif_type]
         structure_name = info.get('structure_name')
         motif_details = info.get('motif_details', [])
-        main_selection = info.get('main_selection')
-        motif_list = info.get('motifs', [])  # For PyMOL object creation
+        main_selection = self.motif_loader.get_main_selection(motif_type)
         
         if not structure_name:
             self.logger.error("No structure name found")
             return False
         
         # Step 0: Create PyMOL object if it doesn't exist (needed for object panel visibility)
-        obj_name = info.get('object_name')
-        if not obj_name and motif_list:
-            # Create the PyMOL object (like HL_all)
-            obj_name = self.motif_loader.selector.create_motif_class_object(
-                structure_name,
-                motif_type,
-                motif_list,
-            )
-            if obj_name:
-                # Color the object with the motif color
-                colors.set_motif_color_in_pymol(self.cmd, obj_name, motif_type)
-                # Update the info dict
-                info['object_name'] = obj_name
-                loaded_motifs[motif_type] = info
-                self.logger.debug(f"Created PyMOL object: {obj_name}")
-        
-        # Step 1: Hide ALL separate motif objects (prevents overlap/stripes)
-        for mt, mt_info in loaded_motifs.items():
-            obj_name_check = mt_info.get('object_name')
-            if obj_name_check:
-                self.cmd.disable(obj_name_check)
-        
-        # Hide any previously created instance objects
-        for obj in self.cmd.get_object_list():
-            for mt in loaded_motifs.keys():
-                if obj.startswith(f"{mt}_") and obj[len(mt)+1:].isdigit():
-                    self.cmd.disable(obj)
+        self.motif_loader.ensure_object(motif_type)
+        
+        # Step 1: Hide ALL separate motif and instance objects (prevents overlap/stripes)
+        self._hide_motif_objects(loaded_motifs)
         
         # Step 2: Show the full structure with uniform representation
         self.cmd.enable(structure_name)
         self.cmd.show('cartoon', f"{structure_name} and polymer.nucleic")
-        self.cmd.set('cartoon_nucleic_acid_mode', 4, structure_name)
-        self.cmd.set('cartoon_tube_radius', 0.4, structure_name)
         
         # Step 3: Color the ENTIRE structure gray80 first
         self.cmd.color('gray80', f"{structure_name} and polymer.nucleic")
@@ -726,35 +1032,18 @@ class VisualizationManager:
             if main_selection:
                 self.cmd.show('cartoon', main_selection)
             
-            # Color each instance individually to avoid PyMOL selection string length limits
+            # Color instances in chunks to avoid PyMOL selection string length limits
             # (Large "or" selections with 100+ instances can exceed PyMOL's parsing limits)
-            from .utils.parser import SelectionParser
+            instance_sels = []
             for detail in motif_details:
-                residues = detail.get('residues', [])
-                if not residues:
+                if not detail.get('residues'):
                     continue
                 
-                # Build selection for this individual instance
-                chain_residues = {}
-                for res in residues:
-                    if isinstance(res, tuple) and len(res) >= 3:
-                        nucleotide, resi, chain = res[0], res[1], res[2]
-                        if chain not in chain_residues:
-                            chain_residues[chain] = []
-                        chain_residues[chain].append(resi)
-                
-                # Create selection for this instance and color it
-                selections = []
-                for chain, resi_list in chain_residues.items():
-                    sel = SelectionParser.create_selection_string(chain, sorted(resi_list))
-                    if sel:
-                        selections.append(f"({sel})")
-                
-                if selections:
-                    combined_sel = " or ".join(selections)
-                    instance_sel = f"({structure_name}) and ({combined_sel})"
-                    # Color this instance with the motif color
-                    colors.set_motif_color_in_pymol(self.cmd, instance_sel, motif_type)
+                combined_sel, _, _ = self._build_instance_selection(detail)
+                if combined_sel:
+                    instance_sels.append(f"({combined_sel})")
+            
+            self._color_selections_chunked(structure_name, instance_sels, motif_type)
         
         # Print instance table
         self._print_motif_instance_table(motif_type, motif_details)
@@ -762,11 +1051,12 @@ class VisualizationManager:
         self.logger.success(f"Showing {len(motif_details)} {motif_type} instances")
         
         # Print follow-up suggestions
-        print("  Next steps:")
-        print(f"    rmv_instance {motif_type} <NO>     View specific instance (1-{len(motif_details)})")
-        print(f"    rmv_show <OTHER_MOTIF>       Show different motif type")
-        print(f"    rmv_all                      Show all motifs")
-        print()
+        if self.verbose:
+            print("  Next steps:")
+            print(f"    rmv_instance {motif_type} <NO>     View specific instance (1-{len(motif_details)})")
+            print(f"    rmv_show <OTHER_MOTIF>       Show different motif type")
+            print(f"    rmv_all                      Show all motifs")
+            print()
         return True
     
     def _create_single_instance_object(self, motif_type: str, instance_no: int,
@@ -783,33 +1073,14 @@ class VisualizationManager:
         Returns:
             True if successful
         """
-        from .utils.parser import SelectionParser
-        
-        residues = detail.get('residues', [])
-        
-        if not residues:
+        if not detail.get('residues'):
             return False
         
         # Build selection for this instance
-        chain_residues = {}
-        for res in residues:
-            if isinstance(res, tuple) and len(res) >= 3:
-                nucleotide, resi, chain = res[0], res[1], res[2]
-                if chain not in chain_residues:
-                    chain_residues[chain] = []
-                chain_residues[chain].append(resi)
-        
-        # Create selection
-        selections = []
-        for chain, resi_list in chain_residues.items():
-            sel = SelectionParser.create_selection_string(chain, sorted(resi_list))
-            if sel:
-                selections.append(f"({sel})")
-        
-        if not selections:
+        combined_sel, _, _ = self._build_instance_selection(detail)
+        if not combined_sel:
             return False
         
-        combined_sel = " or ".join(selections)
         instance_sel = f"({structure_name}) and ({combined_sel})"
         
         # Create object name: MOTIF_NO (e.g., GNRA_1, GNRA_2)
@@ -819,9 +1090,13 @@ class VisualizationManager:
         try:
             self.cmd.create(obj_name, instance_sel)
             self.cmd.show('cartoon', obj_name)
-            self.cmd.set('cartoon_nucleic_acid_mode', 4, obj_name)
-            self.cmd.set('cartoon_tube_radius', 0.4, obj_name)
-            colors.set_motif_color_in_pymol(self.cmd, obj_name, motif_type)
+            self._color_motif(obj_name, motif_type)
+            
+            info = self.motif_loader.get_loaded_motifs().get(motif_type)
+            if info is not None:
+                instance_objects = info.setdefault('instance_objects', [])
+                if obj_name not in instance_objects:
+                    instance_objects.append(obj_name)
             return True
         except Exception as e:
             self.logger.debug(f"Could not create object {obj_name}: {e}")
@@ -835,63 +1110,46 @@ class VisualizationManager:
             motif_type: Motif type
             motif_details: List of motif instance details
         """
-        print("\n" + "=" * 70)
-        print(f"  {motif_type} MOTIF INSTANCES")
-        print("=" * 70)
-        print(f"  Total Instances: {len(motif_details)}")
-        print("-" * 70)
-        print(f"  {'NO.':<6} {'CHAIN':<10} {'RESIDUE RANGE':<25} {'NUCLEOTIDES':<25}")
-        print("-" * 70)
+        buf = io.StringIO()
+        write = buf.write
+        write(f"\n{_HDR_WIDE}\n")
+        write(f"  {motif_type} MOTIF INSTANCES\n")
+        write(f"{_HDR_WIDE}\n")
+        write(f"  Total Instances: {len(motif_details)}\n")
+        write(f"{_SEP_WIDE}\n")
+        write(_INSTANCE_ROW_FMT('NO.', 'CHAIN', 'RESIDUE RANGE', 'NUCLEOTIDES'))
+        write(f"{_SEP_WIDE}\n")
         
         for idx, detail in enumerate(motif_details, 1):
             residues = detail.get('residues', [])
             
             if not residues:
-                print(f"  {idx:<6} {'-':<10} {'-':<25} {'-':<25}")
+                write(_INSTANCE_ROW_FMT(idx, '-', '-', '-'))
                 continue
             
-            # Group by chain
-            chain_info = {}
-            for res in residues:
-                if isinstance(res, tuple) and len(res) >= 3:
-                    nucleotide, resi, chain = res[0], res[1], res[2]
-                    if chain not in chain_info:
-                        chain_info[chain] = {'min': resi, 'max': resi, 'nucs': []}
-                    else:
-                        chain_info[chain]['min'] = min(chain_info[chain]['min'], resi)
-                        chain_info[chain]['max'] = max(chain_info[chain]['max'], resi)
-                    if nucleotide:
-                        chain_info[chain]['nucs'].append(nucleotide)
-            
-            # Format output
-            chains = ', '.join(sorted(chain_info.keys()))
-            
-            # Residue ranges
-            range_parts = []
-            for chain in sorted(chain_info.keys()):
-                ci = chain_info[chain]
-                range_parts.append(f"{chain}:{ci['min']}-{ci['max']}")
-            residue_range = ', '.join(range_parts)
-            
-            # Nucleotides
-            all_nucs = []
-            for chain in sorted(chain_info.keys()):
-                all_nucs.extend(chain_info[chain]['nucs'])
-            nucs_str = ''.join(all_nucs[:20])
-            if len(all_nucs) > 20:
-                nucs_str += '...'
+            # Table columns are precomputed at load time (or on first use)
+            summary = detail.get('_summary')
+            if summary is None:
+                _, chain_residues, _ = self._build_instance_selection(detail)
+                summary = detail.setdefault('_summary', _summarize_instance(detail, chain_residues))
+            chains = summary['chains']
+            residue_range = summary['range_str']
+            nucs_str = summary['nucs_preview']
             
             # Truncate if too long
             if len(residue_range) > 23:
                 residue_range = residue_range[:20] + '...'
             
-            print(f"  {idx:<6} {chains:<10} {residue_range:<25} {nucs_str:<25}")
+            write(_INSTANCE_ROW_FMT(idx, chains, residue_range, nucs_str))
         
-        print("-" * 70)
-        print("\n  To view a specific instance:")
-        print(f"    rmv_instance {motif_type} <NO>")
-        print(f"    Example: rmv_instance {motif_type} 1")
-        print("=" * 70 + "\n")
+        write(f"{_SEP_WIDE}\n")
+        write("\n  To view a specific instance:\n")
+        write(f"    rmv_instance {motif_type} <NO>\n")
+        write(f"    Example: rmv_instance {motif_type} 1\n")
+        write(f"{_HDR_WIDE}\n\n")
+        
+        # One write instead of a print per row
+        sys.stdout.write(buf.getvalue())
     
     def show_motif_instance(self, motif_type: str, instance_no: int) -> bool:
         """
@@ -929,23 +1187,12 @@ class VisualizationManager:
             self.logger.error("No structure name found")
             return False
         
-        # Step 1: Hide ALL separate motif objects
-        for mt, mt_info in loaded_motifs.items():
-            obj_name = mt_info.get('object_name')
-            if obj_name:
-                self.cmd.disable(obj_name)
-        
-        # Hide any previously created instance objects
-        for obj in self.cmd.get_object_list():
-            for mt in loaded_motifs.keys():
-                if obj.startswith(f"{mt}_") and obj[len(mt)+1:].isdigit():
-                    self.cmd.disable(obj)
+        # Step 1: Hide ALL separate motif and instance objects
+        existing_objects = self._hide_motif_objects(loaded_motifs)
         
         # Step 2: Show the full structure with uniform representation in gray80
         self.cmd.enable(structure_name)
         self.cmd.show('cartoon', f"{structure_name} and polymer.nucleic")
-        self.cmd.set('cartoon_nucleic_acid_mode', 4, structure_name)
-        self.cmd.set('cartoon_tube_radius', 0.4, structure_name)
         self.cmd.color('gray80', f"{structure_name} and polymer.nucleic")
         
         # Step 3: Color the instance residues WITHIN the main structure
@@ -954,41 +1201,25 @@ class VisualizationManager:
         instance_obj = f"{motif_type}_{instance_no}"
         
         if residues:
-            from .utils.parser import SelectionParser
-            
-            # Build chain-residue mapping
-            chain_residues = {}
-            for res in residues:
-                if isinstance(res, tuple) and len(res) >= 3:
-                    nucleotide, resi, chain = res[0], res[1], res[2]
-                    if chain not in chain_residues:
-                        chain_residues[chain] = []
-                    chain_residues[chain].append(resi)
-            
             # Create selection for this instance
-            selections = []
-            for chain, resi_list in chain_residues.items():
-                sel = SelectionParser.create_selection_string(chain, sorted(resi_list))
-                if sel:
-                    selections.append(f"({sel})")
+            combined_sel, _, _ = self._build_instance_selection(detail)
             
-            if selections:
-                combined_sel = " or ".join(selections)
+            if combined_sel:
                 instance_sel = f"({structure_name}) and ({combined_sel})"
                 
                 # Color the instance residues WITHIN the main structure (no overlap)
-                colors.set_motif_color_in_pymol(self.cmd, instance_sel, motif_type)
+                self._color_motif(instance_sel, motif_type)
                 
                 # Create object for the panel (disabled - just for reference)
-                existing_objects = self.cmd.get_object_list()
                 if instance_obj not in existing_objects:
                     try:
                         self.cmd.create(instance_obj, instance_sel)
-                        self.cmd.set('cartoon_nucleic_acid_mode', 4, instance_obj)
-                        self.cmd.set('cartoon_tube_radius', 0.4, instance_obj)
-                        colors.set_motif_color_in_pymol(self.cmd, instance_obj, motif_type)
+                        self._color_motif(instance_obj, motif_type)
                         # Disable so it doesn't render (avoids overlap)
                         self.cmd.disable(instance_obj)
+                        instance_objects = info.setdefault('instance_objects', [])
+                        if instance_obj not in instance_objects:
+                            instance_objects.append(instance_obj)
                     except Exception as e:
                         self.logger.debug(f"Could not create instance object: {e}")
                 else:
@@ -1020,27 +1251,31 @@ class VisualizationManager:
         instance_id = detail.get('instance_id', f'{motif_type}_{instance_no}')
         annotation = detail.get('annotation', '')
         
-        print("\n" + "=" * 50)
-        print(f"  {motif_type} INSTANCE #{instance_no}")
-        print("=" * 50)
-        print(f"  Instance ID: {instance_id}")
+        buf = io.StringIO()
+        write = buf.write
+        write(f"\n{_HDR}\n")
+        write(f"  {motif_type} INSTANCE #{instance_no}\n")
+        write(f"{_HDR}\n")
+        write(f"  Instance ID: {instance_id}\n")
         if annotation:
-            print(f"  Annotation: {annotation}")
-        print(f"  Residues: {len(residues)}")
-        print("-" * 50)
+            write(f"  Annotation: {annotation}\n")
+        write(f"  Residues: {len(residues)}\n")
+        write(f"{_SEP}\n")
         
         # List all residues
-        print(f"  {'CHAIN':<8} {'RESI':<8} {'NUCLEOTIDE':<12}")
-        print("-" * 50)
+        write(_RESIDUE_ROW_FMT('CHAIN', 'RESI', 'NUCLEOTIDE'))
+        write(f"{_SEP}\n")
         
         for res in residues:
             if isinstance(res, tuple) and len(res) >= 3:
                 nucleotide, resi, chain = res[0], res[1], res[2]
-                print(f"  {chain:<8} {resi:<8} {nucleotide:<12}")
+                write(_RESIDUE_ROW_FMT(chain, resi, nucleotide))
+        
+        write(f"{_HDR}\n")
+        write(f"  Object: {motif_type}_{instance_no}\n")
+        write(f"{_HDR}\n\n")
         
-        print("=" * 50)
-        print(f"  Object: {motif_type}_{instance_no}")
-        print("=" * 50 + "\n")
+        sys.stdout.write(buf.getvalue())
     
     def show_all_motifs(self) -> None:
         """
@@ -1064,25 +1299,12 @@ class VisualizationManager:
             self.logger.error("No structure loaded")
             return
         
-        # Step 1: Hide ALL separate motif objects (prevents overlap/stripes)
-        for motif_type, info in loaded_motifs.items():
-            obj_name = info.get('object_name')
-            if obj_name:
-                self.cmd.disable(obj_name)
-            
-            # Also disable individual instance objects
-            motif_details = info.get('motif_details', [])
-            for i in range(1, len(motif_details) + 1):
-                try:
-                    self.cmd.disable(f"{motif_type}_{i}")
-                except:
-                    pass
+        # Step 1: Hide ALL separate motif and instance objects (prevents overlap/stripes)
+        self._hide_motif_objects(loaded_motifs)
         
         # Step 2: Show the full structure with uniform representation
         self.cmd.enable(structure_name)
         self.cmd.show('cartoon', f"{structure_name} and polymer.nucleic")
-        self.cmd.set('cartoon_nucleic_acid_mode', 4, structure_name)
-        self.cmd.set('cartoon_tube_radius', 0.4, structure_name)
         
         # Step 3: Color the ENTIRE structure gray80 first
         self.cmd.color('gray80', f"{structure_name} and polymer.nucleic")
@@ -1093,45 +1315,41 @@ class VisualizationManager:
             if not motif_details:
                 continue
             
-            # Color each instance individually to avoid PyMOL selection string length limits
-            from .utils.parser import SelectionParser
+            # Union every instance's residues per chain; range collapsing
+            # keeps each chain's clause short
+            merged: Dict[str, set] = {}
             for detail in motif_details:
-                residues = detail.get('residues', [])
-                if not residues:
+                if not detail.get('residues'):
                     continue
-                
-                # Build selection for this individual instance
-                chain_residues = {}
-                for res in residues:
-                    if isinstance(res, tuple) and len(res) >= 3:
-                        nucleotide, resi, chain = res[0], res[1], res[2]
-                        if chain not in chain_residues:
-                            chain_residues[chain] = []
-                        chain_residues[chain].append(resi)
-                
-                # Create selection for this instance and color it
-                selections = []
+                _, chain_residues, _ = self._build_instance_selection(detail)
                 for chain, resi_list in chain_residues.items():
-                    sel = SelectionParser.create_selection_string(chain, sorted(resi_list))
-                    if sel:
-                        selections.append(f"({sel})")
-                
-                if selections:
-                    combined_sel = " or ".join(selections)
-                    instance_sel = f"({structure_name}) and ({combined_sel})"
-                    # Show and color this instance
-                    try:
-                        self.cmd.show('cartoon', instance_sel)
-                        colors.set_motif_color_in_pymol(self.cmd, instance_sel, motif_type)
-                    except Exception as e:
-                        self.logger.debug(f"Could not color instance {motif_type}: {e}")
+                    merged.setdefault(chain, set()).update(resi_list)
+            
+            chain_sels = [
+                f"({sel})"
+                for sel in (
+                    cached_selection_string(chain, tuple(sorted(resi_set)))
+                    for chain, resi_set in merged.items()
+                )
+                if sel
+            ]
+            if not chain_sels:
+                continue
+            
+            # Usually one call per motif type; scattered residues on large
+            # structures are split by chain to stay under MAX_SELECTION_LENGTH
+            try:
+                self._color_selections_chunked(structure_name, chain_sels, motif_type,
+                                               show_cartoon=True)
+            except Exception as e:
+                self.logger.warning(f"Could not color motif type {motif_type}: {e}")
         
         self.logger.info("All motifs shown")
         
         # Print follow-up suggestions
         print("\n  Next steps:")
         if loaded_motifs:
-            first_motif = next(iter(sorted(loaded_motifs.keys())), None)
+            first_motif = next(iter(loaded_motifs), None)
             if first_motif:
                 print(f"    rmv_show {first_motif:<20}  Highlight specific motif type")
         print(f"    rmv_summary              View motif summary table")
@@ -5,20 +5,42 @@ Convenience wrapper around AtlasMotifLoader for fast, grouped lookups.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from .atlas_loader import get_atlas_loader
 
 
 class PDBMotifMapper:
+    # Number of PDBs whose grouped motifs are kept in memory
+    DEFAULT_CACHE_SIZE = 64
+
     def __init__(self, motif_db_path: Optional[str] = None):
         self.loader = get_atlas_loader(motif_db_path)
-        self._cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._cache: "OrderedDict[str, Dict[str, List[Dict[str, Any]]]]" = OrderedDict()
+        self._max_cache = self.DEFAULT_CACHE_SIZE
+
+    def set_cache_size(self, size: int) -> None:
+        """Bound the per-PDB cache to `size` entries, evicting the oldest."""
+        self._max_cache = max(1, int(size))
+        while len(self._cache) > self._max_cache:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _norm(pid: str) -> str:
+        """Uppercase an ID, skipping the copy when it already is."""
+        return pid if pid.isupper() else pid.upper()
 
     def get_available_motifs(self, pdb_id: str) -> Dict[str, List[Dict[str, Any]]]:
-        pdb_id = pdb_id.upper()
-        if pdb_id in self._cache:
-            return self._cache[pdb_id]
+        return self._grouped(self._norm(pdb_id))
+
+    def _grouped(self, pdb_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Grouped motifs for an already-uppercased PDB ID (cached)."""
+        cached = self._cache.get(pdb_id)
+        if cached is not None:
+            self._cache.move_to_end(pdb_id)
+            return cached
 
         motifs = self.loader.get_motifs_for_pdb(pdb_id)
         grouped: Dict[str, List[Dict[str, Any]]] = {}
@@ -27,33 +49,42 @@ class PDBMotifMapper:
             grouped.setdefault(motif_type, []).append(motif)
 
         self._cache[pdb_id] = grouped
+        if len(self._cache) > self._max_cache:
+            self._cache.popitem(last=False)
         return grouped
 
     def get_motifs_by_type(self, pdb_id: str, motif_type: str) -> List[Dict[str, Any]]:
-        return self.get_available_motifs(pdb_id).get(motif_type.upper(), [])
+        return self._grouped(self._norm(pdb_id)).get(self._norm(motif_type), [])
 
     def count_motifs(self, pdb_id: str) -> int:
-        return sum(len(v) for v in self.get_available_motifs(pdb_id).values())
+        return sum(len(v) for v in self._grouped(self._norm(pdb_id)).values())
 
     def pdb_has_motifs(self, pdb_id: str) -> bool:
         return self.count_motifs(pdb_id) > 0
 
     def get_summary(self, pdb_id: str) -> str:
-        grouped = self.get_available_motifs(pdb_id)
+        pdb_id = self._norm(pdb_id)
+        grouped = self._grouped(pdb_id)
         if not grouped:
-            return f"No motifs found in {pdb_id.upper()}"
+            return f"No motifs found in {pdb_id}"
 
-        lines = [f"Motifs in {pdb_id.upper()}:" ]
+        lines = [f"Motifs in {pdb_id}:" ]
         for motif_type in sorted(grouped.keys()):
             lines.append(f"  {motif_type}: {len(grouped[motif_type])} instances")
         return "\n".join(lines)
 
 
 _mapper_instance: Optional[PDBMotifMapper] = None
+_init_lock = threading.Lock()
 
 
 def get_pdb_mapper(motif_db_path: Optional[str] = None) -> PDBMotifMapper:
     global _mapper_instance
-    if _mapper_instance is None:
-        _mapper_instance = PDBMotifMapper(motif_db_path)
-    return _mapper_instance
+    inst = _mapper_instance
+    if inst is None:
+        with _init_lock:
+            inst = _mapper_instance
+            if inst is None:
+                inst = PDBMotifMapper(motif_db_path)
+                _mapper_instance = inst
+    return inst
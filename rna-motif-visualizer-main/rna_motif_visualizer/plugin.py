@@ -21,6 +21,7 @@ Usage in PyMOL:
     rmv_status                           # Show current status
 """
 
+import sys
 from pymol import cmd
 from pathlib import Path
 from .gui import initialize_gui
@@ -29,6 +30,47 @@ from .database import initialize_registry, get_registry
 from datetime import datetime
 
 
+# Welcome banner, built once at import. Text rows are padded to the box
+# width with ljust(); the title row leaves room for the two wide emoji.
+_LAST_UPDATED = "January 19, 2025"
+_BOX_WIDTH = 78
+_WELCOME = "\n".join([
+    "",
+    "=" * 80,
+    "┌" + " " * _BOX_WIDTH + "┐",
+    "│" + (" " * 20 + "🧬 RNA MOTIF VISUALIZER 🧬").ljust(_BOX_WIDTH - 2) + "│",
+    "│" + " " * _BOX_WIDTH + "│",
+    "│" + " Version 2.1.0".ljust(_BOX_WIDTH) + "│",
+    "│" + f" Last Updated: {_LAST_UPDATED}".ljust(_BOX_WIDTH) + "│",
+    "│" + " " * _BOX_WIDTH + "│",
+    "│" + " Multi-source RNA structural motif visualization for PyMOL".ljust(_BOX_WIDTH) + "│",
+    "│" + " Fast loading: Load PDB first, render motifs on demand".ljust(_BOX_WIDTH) + "│",
+    "│" + " " * _BOX_WIDTH + "│",
+    "└" + " " * _BOX_WIDTH + "┘",
+    "=" * 80,
+    "",
+    "📊 AVAILABLE DATA SOURCES:",
+    "   • Local:       RNA 3D Atlas, Rfam (offline)",
+    "   • Online:      BGSU RNA 3D Hub, Rfam API",
+    "   • Annotations: User annotations (FR3D, RNAMotifScan)",
+    "",
+    "⚡ QUICK START:",
+    "   rmv_source web bgsu      # Select online BGSU source",
+    "   rmv_fetch 1S72           # Load PDB structure",
+    "   rmv_summary              # Show available motifs",
+    "   rmv_show HL              # Render hairpin loops",
+    "",
+    "📚 COMMANDS & HELP:",
+    "   rmv_help                 # All available commands",
+    "   rmv_sources              # List all data sources",
+    "   rmv_status               # Current plugin status",
+    "",
+    "=" * 80,
+    "",
+    "",
+])
+
+
 def __init_plugin__(app):
     """
     Initialize plugin in PyMOL with multi-database support.
@@ -76,33 +118,7 @@ def __init_plugin__(app):
     initialize_gui()
     
     # Print professional welcome message
-    last_updated = "January 19, 2025"
-    print("\n" + "="*80)
-    print("┌" + " "*78 + "┐")
-    print("│" + " "*20 + "🧬 RNA MOTIF VISUALIZER 🧬" + " "*32 + "│")
-    print("│" + " "*78 + "│")
-    print("│" + " Version 2.1.0" + " "*63 + "│")
-    print("│" + " Last Updated: " + last_updated + " "*44 + "│")
-    print("│" + " "*78 + "│")
-    print("│" + " Multi-source RNA structural motif visualization for PyMOL" + " "*18 + "│")
-    print("│" + " Fast loading: Load PDB first, render motifs on demand" + " "*23 + "│")
-    print("│" + " "*78 + "│")
-    print("└" + " "*78 + "┘")
-    print("="*80)
-    print("\n📊 AVAILABLE DATA SOURCES:")
-    print("   • Local:       RNA 3D Atlas, Rfam (offline)")
-    print("   • Online:      BGSU RNA 3D Hub, Rfam API")
-    print("   • Annotations: User annotations (FR3D, RNAMotifScan)")
-    print("\n⚡ QUICK START:")
-    print("   rmv_source web bgsu      # Select online BGSU source")
-    print("   rmv_fetch 1S72           # Load PDB structure")
-    print("   rmv_summary              # Show available motifs")
-    print("   rmv_show HL              # Render hairpin loops")
-    print("\n📚 COMMANDS & HELP:")
-    print("   rmv_help                 # All available commands")
-    print("   rmv_sources              # List all data sources")
-    print("   rmv_status               # Current plugin status")
-    print("\n" + "="*80 + "\n")
+    sys.stdout.write(_WELCOME)
 
 
 # Module metadata
@@ -3,7 +3,7 @@ RNA Motif Visualizer - Utilities Package
 """
 
 from .logger import get_logger, initialize_logger
-from .parser import PDBParser, SelectionParser
+from .parser import PDBParser, SelectionParser, MotifSoA, cached_selection_string
 from .selectors import MotifSelector
 
 __all__ = [
@@ -11,5 +11,7 @@ __all__ = [
     'initialize_logger',
     'PDBParser',
     'SelectionParser',
+    'MotifSoA',
+    'cached_selection_string',
     'MotifSelector',
 ]
@@ -3,8 +3,29 @@ RNA Motif Visualizer - Logging Module
 Provides unified logging for the plugin with optional PyMOL console output.
 """
 
+import atexit
 import sys
-from datetime import datetime
+import threading
+import time
+
+# Level tags, built once instead of per message
+_LEVEL_PREFIXES = {
+    level: f"[{level}] "
+    for level in ("INFO", "WARNING", "ERROR", "DEBUG", "SUCCESS")
+}
+
+# [epoch second, formatted timestamp] shared by all loggers
+_ts_cache = [0, ""]
+
+
+def _ts():
+    """Current time as text, reformatted only when the second changes."""
+    now = int(time.time())
+    cache = _ts_cache
+    if cache[0] != now:
+        cache[0] = now
+        cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    return cache[1]
 
 
 class PluginLogger:
@@ -19,64 +40,103 @@ class PluginLogger:
         """
         self.use_pymol_console = use_pymol_console
         self.log_file = None
+        self._fh = None
     
     def set_log_file(self, filepath):
-        """Set optional log file path."""
+        """Set optional log file path (kept open, line-buffered)."""
+        self._close()
         self.log_file = filepath
+        if filepath:
+            try:
+                self._fh = open(filepath, 'a', buffering=1)
+            except Exception as e:
+                print(f"Warning: Could not open log file: {e}")
+    
+    def _close(self):
+        """Close the log file handle, if any."""
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                fh.close()
+            except Exception:
+                pass
     
     def _format_message(self, level, message):
         """Format log message with timestamp."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return f"[{timestamp}] [{level}] {message}"
+        prefix = _LEVEL_PREFIXES.get(level) or f"[{level}] "
+        return f"[{_ts()}] {prefix}{message}"
     
     def _write(self, formatted_msg):
         """Write message to appropriate outputs."""
-        print(formatted_msg)
+        sys.stdout.write(formatted_msg + '\n')
         
-        if self.log_file:
+        if self._fh is not None:
             try:
-                with open(self.log_file, 'a') as f:
-                    f.write(formatted_msg + '\n')
+                self._fh.write(formatted_msg + '\n')
             except Exception as e:
                 print(f"Warning: Could not write to log file: {e}")
     
-    def info(self, message):
+    def _log(self, level, message, args):
+        """Format %-style args (only when given) and write the message."""
+        if args:
+            message = message % args
+        self._write(self._format_message(level, message))
+    
+    def info(self, message, *args):
         """Log info level message."""
-        self._write(self._format_message("INFO", message))
+        self._log("INFO", message, args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning level message."""
-        self._write(self._format_message("WARNING", message))
+        self._log("WARNING", message, args)
     
-    def error(self, message):
+    def error(self, message, *args):
         """Log error level message."""
-        self._write(self._format_message("ERROR", message))
+        self._log("ERROR", message, args)
     
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug level message."""
-        self._write(self._format_message("DEBUG", message))
+        self._log("DEBUG", message, args)
     
-    def success(self, message):
+    def success(self, message, *args):
         """Log success level message."""
-        self._write(self._format_message("SUCCESS", message))
+        self._log("SUCCESS", message, args)
 
 
 # Global logger instance
 _logger = None
+_init_lock = threading.Lock()
 
 
 def get_logger():
-    """Get or create global logger instance."""
+    """Get or create global logger instance (thread-safe, lock-free once created)."""
     global _logger
-    if _logger is None:
-        _logger = PluginLogger(use_pymol_console=True)
-    return _logger
+    logger = _logger
+    if logger is None:
+        with _init_lock:
+            logger = _logger
+            if logger is None:
+                logger = PluginLogger(use_pymol_console=True)
+                _logger = logger
+    return logger
 
 
 def initialize_logger(use_pymol_console=False, log_file=None):
     """Initialize global logger."""
     global _logger
-    _logger = PluginLogger(use_pymol_console=use_pymol_console)
+    logger = PluginLogger(use_pymol_console=use_pymol_console)
     if log_file:
-        _logger.set_log_file(log_file)
-    return _logger
+        logger.set_log_file(log_file)
+    with _init_lock:
+        previous, _logger = _logger, logger
+    if previous is not None:
+        previous._close()
+    return logger
+
+
+@atexit.register
+def _close_current_logger():
+    """Close the current global logger's log file at exit."""
+    logger = _logger
+    if logger is not None:
+        logger._close()
@@ -3,7 +3,41 @@ RNA Motif Visualizer - Parser Module
 Handles parsing of PDB/mmCIF filenames (PDB ID extraction) and selection formatting.
 """
 
-import os
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
+
+
+def _is_pdb_id(text):
+    """True if text looks like a PDB ID (4 ASCII alphanumeric characters)."""
+    return len(text) == 4 and text.isascii() and text.isalnum()
+
+
+@lru_cache(maxsize=1024)
+def _extract_pdb_id_cached(filepath_or_id):
+    """Cached implementation of PDBParser.extract_pdb_id."""
+    # Check if it's already a PDB ID (4 characters, alphanumeric)
+    if _is_pdb_id(filepath_or_id):
+        return filepath_or_id.upper()
+    
+    # Try to extract from filename (handles both / and \ separators)
+    filename = filepath_or_id.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+    # PDB files often named like "1s72.pdb" or "1S72.cif"
+    if filename:
+        name_without_ext = filename.rpartition('.')[0] or filename
+        if len(name_without_ext) >= 4:
+            potential_id = name_without_ext[:4]
+            if potential_id.isascii() and potential_id.isalnum():
+                return potential_id.upper()
+    
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_pdb_id_cached(pdb_id):
+    """Cached implementation of PDBParser.is_valid_pdb_id for strings."""
+    return _is_pdb_id(pdb_id)
 
 
 class PDBParser:
@@ -14,27 +48,15 @@ class PDBParser:
         """
         Extract PDB ID from file path or return if already a PDB ID.
         
+        Results are memoized, since the same paths and IDs recur across commands.
+        
         Args:
             filepath_or_id (str): Either a PDB ID or file path
         
         Returns:
             str: PDB ID (4 characters) or None if invalid
         """
-        # Check if it's already a PDB ID (4 characters, alphanumeric)
-        if len(filepath_or_id) == 4 and filepath_or_id.isalnum():
-            return filepath_or_id.upper()
-        
-        # Try to extract from filename
-        filename = os.path.basename(filepath_or_id)
-        # PDB files often named like "1s72.pdb" or "1S72.cif"
-        if filename:
-            name_without_ext = os.path.splitext(filename)[0]
-            if len(name_without_ext) >= 4:
-                potential_id = name_without_ext[:4]
-                if potential_id.isalnum():
-                    return potential_id.upper()
-        
-        return None
+        return _extract_pdb_id_cached(filepath_or_id)
     
     @staticmethod
     def is_valid_pdb_id(pdb_id):
@@ -49,7 +71,54 @@ class PDBParser:
         """
         if not isinstance(pdb_id, str):
             return False
-        return len(pdb_id) == 4 and pdb_id.isalnum()
+        return _is_valid_pdb_id_cached(pdb_id)
+
+
+def residue_runs(residues):
+    """
+    Collapse residue numbers into runs of consecutive values.
+    
+    Args:
+        residues (iterable): Residue numbers (any order, duplicates allowed)
+    
+    Returns:
+        list: (start, end) tuples in ascending order, e.g. [(12, 30), (45, 45)]
+    """
+    values = sorted(set(residues))
+    if not values:
+        return []
+    
+    # Single pass: close a run whenever the next value is not prev + 1
+    runs = []
+    start = prev = values[0]
+    for value in values[1:]:
+        if value != prev + 1:
+            runs.append((start, prev))
+            start = value
+        prev = value
+    runs.append((start, prev))
+    return runs
+
+
+def _resi_token(resi):
+    """Format one residue number for a resi clause (PyMOL needs "\\-" for negatives)."""
+    return f"\\{resi}" if resi < 0 else f"{resi}"
+
+
+def _collapse_ranges(residues):
+    """
+    Render residue numbers in PyMOL's compact resi syntax.
+    
+    Args:
+        residues (iterable): Residue numbers (any order, duplicates allowed)
+    
+    Returns:
+        str: e.g. "1-5+8+10-12", or "\\-2-0+4" with negative numbers
+    """
+    return "+".join(
+        f"{_resi_token(start)}-{_resi_token(end)}" if end != start else _resi_token(start)
+        for start, end in residue_runs(residues)
+    )
 
 
 class SelectionParser:
@@ -64,34 +133,78 @@ class SelectionParser:
             chain (str): Chain identifier
             residues (list): List of residue numbers
         
+        Contiguous residue numbers are collapsed into ranges, so gaps
+        between separate strands of a motif are not selected.
+        
         Returns:
-            str: PyMOL selection string (e.g., "chain A and resi 77-82")
+            str: PyMOL selection string (e.g., "chain A and resi 77-82+90-93")
         """
         if not residues:
             return None
         
-        residues = sorted(residues)
-        selection = f"chain {chain} and resi {residues[0]}-{residues[-1]}"
+        selection = f"chain {chain} and resi {_collapse_ranges(residues)}"
         return selection
     
+    @staticmethod
+    def create_multichain_selection(chain_residues):
+        """
+        Create one PyMOL selection string covering residues on several chains.
+        
+        Args:
+            chain_residues (dict): Chain identifier -> list of residue numbers
+        
+        Returns:
+            str: Selection like "(chain A and resi 1-5+10-12) or (chain B and resi 7-9)",
+                 or None if no chain has residues. A single chain is returned
+                 unparenthesised, so callers wrap the result exactly once.
+        """
+        selections = [
+            sel
+            for sel in (
+                cached_selection_string(chain, tuple(residues))
+                for chain, residues in chain_residues.items()
+            )
+            if sel
+        ]
+        if len(selections) == 1:
+            return selections[0]
+        return " or ".join(f"({sel})" for sel in selections) or None
+    
     @staticmethod
     def create_detailed_selection(chain, residues):
         """
         Create a detailed PyMOL selection string listing all residues.
         
+        Uses PyMOL's native multi-value resi syntax, with consecutive
+        residues collapsed into ranges.
+        
         Args:
             chain (str): Chain identifier
             residues (list): List of residue numbers
         
         Returns:
-            str: Detailed PyMOL selection string
+            str: Detailed PyMOL selection string (e.g., "chain A and resi 1-5+8+10-12")
         """
-        if not residues:
-            return None
-        
-        residue_list = "+".join([f"resi {r}" for r in sorted(residues)])
-        selection = f"chain {chain} and ({residue_list})"
-        return selection
+        return SelectionParser.create_selection_string(chain, residues)
+
+
+@lru_cache(maxsize=4096)
+def cached_selection_string(chain, residues):
+    """
+    Memoized SelectionParser.create_selection_string.
+    
+    Args:
+        chain (str): Chain identifier
+        residues (tuple): Residue numbers (must be a tuple to be hashable)
+    
+    Returns:
+        str: PyMOL selection string, or None if residues is empty
+    """
+    return SelectionParser.create_selection_string(chain, list(residues))
+
+
+# Fetches the required motif fields in a single call (KeyError if any is missing)
+_required_fields_getter = itemgetter('chain', 'residues', 'motif_id')
 
 
 def validate_motif_data(motif_entry):
@@ -104,7 +217,79 @@ def validate_motif_data(motif_entry):
     Returns:
         bool: True if valid
     """
-    required_fields = ['chain', 'residues', 'motif_id']
-    return all(field in motif_entry for field in required_fields) and \
-           isinstance(motif_entry.get('residues'), list) and \
-           len(motif_entry.get('residues', [])) > 0
+    try:
+        _, residues, _ = _required_fields_getter(motif_entry)
+    except (KeyError, TypeError):
+        return False
+    return type(residues) is list and len(residues) > 0
+
+
+@dataclass
+class MotifSoA:
+    """
+    Motif residues stored as parallel flat arrays (structure of arrays).
+    
+    Entry i covers residues resi_data[resi_starts[i]:resi_starts[i + 1]]
+    on chain chains[i]. Residue numbers are packed into array('i') instead
+    of one list of boxed ints per motif dict.
+    
+    Attributes:
+        chains: Chain identifier per entry
+        motif_ids: Motif ID per entry
+        resi_starts: Offsets into resi_data (one more than the entry count)
+        resi_data: Residue numbers of all entries, concatenated
+    """
+    chains: list = field(default_factory=list)
+    motif_ids: list = field(default_factory=list)
+    resi_starts: array = field(default_factory=lambda: array('i', [0]))
+    resi_data: array = field(default_factory=lambda: array('i'))
+    
+    # Memoized chain_residues() result (entries are not modified after building)
+    _chain_residues: dict = field(default=None, init=False, repr=False, compare=False)
+    
+    def __len__(self):
+        return len(self.chains)
+    
+    @classmethod
+    def from_motif_list(cls, motif_list, on_invalid=None):
+        """
+        Build from legacy motif dictionaries (keys: chain, residues, motif_id).
+        
+        Args:
+            motif_list (list): Motif dictionaries
+            on_invalid (callable): Called with each invalid entry, which is skipped
+        
+        Returns:
+            MotifSoA: Flattened motifs
+        """
+        soa = cls()
+        chains_append = soa.chains.append
+        ids_append = soa.motif_ids.append
+        starts_append = soa.resi_starts.append
+        data = soa.resi_data
+        for motif in motif_list:
+            if not validate_motif_data(motif):
+                if on_invalid is not None:
+                    on_invalid(motif)
+                continue
+            chains_append(motif['chain'])
+            ids_append(motif['motif_id'])
+            data.extend(motif['residues'])
+            starts_append(len(data))
+        return soa
+    
+    def chain_residues(self):
+        """
+        Merge residues of all entries per chain.
+        
+        Returns:
+            dict: Chain identifier -> sorted unique residue numbers
+        """
+        if self._chain_residues is None:
+            starts = self.resi_starts
+            data = self.resi_data
+            merged = {}
+            for i, chain in enumerate(self.chains):
+                merged.setdefault(chain, set()).update(data[starts[i]:starts[i + 1]])
+            self._chain_residues = {chain: sorted(resset) for chain, resset in merged.items()}
+        return self._chain_residues
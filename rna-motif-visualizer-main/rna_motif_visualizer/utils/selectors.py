@@ -3,13 +3,22 @@ RNA Motif Visualizer - Selection Module
 Handles creation and management of PyMOL selections for motifs.
 """
 
-from .parser import SelectionParser, validate_motif_data
+import re
+
+from .. import colors
+from .parser import MotifSoA, SelectionParser, cached_selection_string, validate_motif_data
 from .logger import get_logger
 
 
 class MotifSelector:
     """Manages PyMOL selections for RNA motifs."""
     
+    # Motif object names: class objects (X_ALL) and per-chain objects (X_id_A, X_id_K)
+    _MOTIF_OBJ_RE = re.compile(r'_(?:ALL|K|A)')
+    
+    # Session-wide PyMOL settings are applied by the first selector only
+    _globals_set = False
+    
     def __init__(self, cmd):
         """
         Initialize selector.
@@ -19,6 +28,46 @@ class MotifSelector:
         """
         self.cmd = cmd
         self.logger = get_logger()
+        
+        if not MotifSelector._globals_set:
+            try:
+                self.cmd.set('cartoon_fancy_helices', 1)
+                # Preregister the motif palette so coloring needs no set_color
+                colors.register_all_colors(self.cmd)
+                MotifSelector._globals_set = True
+            except Exception as e:
+                self.logger.debug("Could not apply session settings: %s", e)
+    
+    @staticmethod
+    def clear_selection_cache():
+        """Drop memoized selection strings (shared with the loader)."""
+        cached_selection_string.cache_clear()
+    
+    def _warn_invalid_motif(self, motif):
+        """Log a skipped invalid motif entry."""
+        self.logger.warning("Skipping invalid motif: %s", motif)
+    
+    def _combined_chain_selection(self, motifs, warn_invalid=False):
+        """
+        Build one selection covering every motif, grouped by chain.
+        
+        Residues shared between motifs appear once, and each chain becomes a
+        single "chain X and resi a-b+c" clause.
+        
+        Args:
+            motifs (MotifSoA or list): Flattened motifs, or motif dictionaries
+                with keys: chain, residues, motif_id
+            warn_invalid (bool): Log a warning for each invalid motif skipped
+        
+        Returns:
+            str: Combined selection, or None if no motif is valid
+        """
+        if not isinstance(motifs, MotifSoA):
+            motifs = MotifSoA.from_motif_list(
+                motifs, self._warn_invalid_motif if warn_invalid else None
+            )
+        
+        return SelectionParser.create_multichain_selection(motifs.chain_residues())
     
     def create_motif_object(self, structure_name, motif_type, motif_id, chain, residues):
         """
@@ -42,7 +91,7 @@ class MotifSelector:
             obj_name = f"{motif_type}_{motif_id}_{chain}"
             
             # Create selection
-            selection = SelectionParser.create_selection_string(chain, residues)
+            selection = cached_selection_string(chain, tuple(residues))
             if not selection:
                 return None
             
@@ -52,7 +101,7 @@ class MotifSelector:
             
             return obj_name
         except Exception as e:
-            self.logger.error(f"Failed to create motif object: {e}")
+            self.logger.error("Failed to create motif object: %s", e)
             return None
     
     def create_motif_class_object(self, structure_name, motif_type, motif_list):
@@ -62,7 +111,8 @@ class MotifSelector:
         Args:
             structure_name (str): Name of the loaded structure
             motif_type (str): Type of motif (e.g., 'KTURN')
-            motif_list (list): List of motif dictionaries with keys: chain, residues, motif_id
+            motif_list (MotifSoA or list): Flattened motifs, or motif dictionaries
+                with keys: chain, residues, motif_id
         
         Returns:
             str: Name of created PyMOL object (e.g., 'KTURN_ALL')
@@ -73,35 +123,21 @@ class MotifSelector:
         try:
             obj_name = f"{motif_type}_ALL"
             
-            # Collect all selection strings
-            selections = []
-            for motif in motif_list:
-                if not validate_motif_data(motif):
-                    self.logger.warning(f"Skipping invalid motif: {motif}")
-                    continue
-                
-                chain = motif.get('chain')
-                residues = motif.get('residues')
-                
-                selection = SelectionParser.create_selection_string(chain, residues)
-                if selection:
-                    selections.append(selection)
-            
-            if not selections:
-                self.logger.warning(f"No valid selections found for {motif_type}")
+            # One deduplicated residue set per chain
+            combined_selection = self._combined_chain_selection(motif_list, warn_invalid=True)
+            if not combined_selection:
+                self.logger.warning("No valid selections found for %s", motif_type)
                 return None
             
-            # Combine all selections with OR
-            combined_selection = " or ".join([f"({s})" for s in selections])
             full_selection = f"({structure_name}) and ({combined_selection})"
             
             # Create combined object
             self.cmd.create(obj_name, full_selection)
-            self.logger.info(f"Created motif object: {obj_name}")
+            self.logger.info("Created motif object: %s", obj_name)
             
             return obj_name
         except Exception as e:
-            self.logger.error(f"Failed to create motif class object {motif_type}: {e}")
+            self.logger.error("Failed to create motif class object %s: %s", motif_type, e)
             return None
     
     def color_motif_residues(self, structure_name, motif_type, motif_list, color_rgb):
@@ -112,7 +148,8 @@ class MotifSelector:
         Args:
             structure_name (str): Name of the loaded structure
             motif_type (str): Type of motif (e.g., 'KTURN')
-            motif_list (list): List of motif dictionaries with keys: chain, residues
+            motif_list (MotifSoA or list): Flattened motifs, or motif dictionaries
+                with keys: chain, residues
             color_rgb (tuple): RGB color tuple (0-1 range)
         
         Returns:
@@ -124,42 +161,28 @@ class MotifSelector:
         try:
             selection_name = f"{motif_type}_sel"
             
-            # Collect all selection strings
-            selections = []
-            for motif in motif_list:
-                if not validate_motif_data(motif):
-                    continue
-                
-                chain = motif.get('chain')
-                residues = motif.get('residues')
-                
-                selection = SelectionParser.create_selection_string(chain, residues)
-                if selection:
-                    selections.append(selection)
-            
-            if not selections:
+            # One deduplicated residue set per chain
+            combined_selection = self._combined_chain_selection(motif_list)
+            if not combined_selection:
                 return None
             
-            # Combine all selections
-            combined_selection = " or ".join([f"({s})" for s in selections])
             full_selection = f"({structure_name}) and ({combined_selection})"
             
             # Create a named selection (not a new object)
             self.cmd.select(selection_name, full_selection)
             
-            # Define and apply color
-            color_name = f"motif_{motif_type}"
-            self.cmd.set_color(color_name, color_rgb)
+            # Apply color (defined only if not already registered with this RGB)
+            color_name = colors.register_color(self.cmd, f"motif_{motif_type}", color_rgb)
             self.cmd.color(color_name, selection_name)
             
             # Hide the selection indicator (the pink squares)
             self.cmd.deselect()
             
-            self.logger.info(f"Colored {motif_type} residues directly on structure")
+            self.logger.info("Colored %s residues directly on structure", motif_type)
             
             return selection_name
         except Exception as e:
-            self.logger.error(f"Failed to color motif residues {motif_type}: {e}")
+            self.logger.error("Failed to color motif residues %s: %s", motif_type, e)
             return None
     
     def toggle_object_visibility(self, obj_name, visible):
@@ -176,9 +199,9 @@ class MotifSelector:
                 self.cmd.show('cartoon', obj_name)
             else:
                 self.cmd.hide('everything', obj_name)
-            self.logger.debug(f"Set visibility of {obj_name} to {visible}")
+            self.logger.debug("Set visibility of %s to %s", obj_name, visible)
         except Exception as e:
-            self.logger.error(f"Failed to toggle visibility of {obj_name}: {e}")
+            self.logger.error("Failed to toggle visibility of %s: %s", obj_name, e)
     
     def delete_object(self, obj_name):
         """
@@ -189,9 +212,10 @@ class MotifSelector:
         """
         try:
             self.cmd.delete(obj_name)
-            self.logger.debug(f"Deleted object: {obj_name}")
+            self.clear_selection_cache()
+            self.logger.debug("Deleted object: %s", obj_name)
         except Exception as e:
-            self.logger.error(f"Failed to delete object {obj_name}: {e}")
+            self.logger.error("Failed to delete object %s: %s", obj_name, e)
     
     def highlight_object(self, obj_name):
         """
@@ -204,9 +228,8 @@ class MotifSelector:
             self.cmd.show('sticks', obj_name)
             self.cmd.show('cartoon', obj_name)
             self.cmd.set('stick_radius', 0.3, obj_name)
-            self.cmd.set('cartoon_fancy_helices', 1)
         except Exception as e:
-            self.logger.error(f"Failed to highlight object {obj_name}: {e}")
+            self.logger.error("Failed to highlight object %s: %s", obj_name, e)
     
     def get_all_motif_objects(self):
         """
@@ -216,9 +239,7 @@ class MotifSelector:
             list: Names of all objects
         """
         try:
-            all_objects = self.cmd.get_names('objects')
-            motif_objects = [obj for obj in all_objects if '_ALL' in obj or '_K' in obj or '_A' in obj]
-            return motif_objects
+            return list(filter(self._MOTIF_OBJ_RE.search, self.cmd.get_names('objects')))
         except Exception as e:
-            self.logger.error(f"Failed to get motif objects: {e}")
+            self.logger.error("Failed to get motif objects: %s", e)
             return []
@@ -4,13 +4,29 @@ Test script for RNA Motif Visualizer API providers.
 Tests the new multi-source provider system.
 """
 
+import argparse
+import importlib
+import io
+import os
 import sys
 import tempfile
+import threading
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Add the project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+
+@lru_cache(maxsize=None)
+def _get(name):
+    """Import rna_motif_visualizer.database.<name> on first use."""
+    return importlib.import_module(f"rna_motif_visualizer.database.{name}")
+
+
 def test_imports():
     """Test 1: Verify all modules can be imported."""
     print("=" * 60)
@@ -63,11 +79,10 @@ def test_config():
     print("TEST 2: Configuration module")
     print("=" * 60)
     
-    from rna_motif_visualizer.database.config import (
-        PluginConfig, SourceMode, CachePolicy, get_config
-    )
+    config_module = _get("config")
+    SourceMode = config_module.SourceMode
     
-    config = get_config()
+    config = config_module.get_config()
     print(f"✓ Default source mode: {config.source_mode.value}")
     print(f"✓ Source priority: {config.source_priority}")
     print(f"✓ Cache days: {config.freshness_policy.cache_days}")
@@ -87,49 +102,49 @@ def test_config():
     return True
 
 
-def test_cache_manager():
-    """Test 3: Test cache manager."""
+def test_cache_manager(tmpdir):
+    """Test 3: Test cache manager (in the shared temp directory)."""
     print("\n" + "=" * 60)
     print("TEST 3: Cache manager")
     print("=" * 60)
     
-    from rna_motif_visualizer.database.cache_manager import CacheManager
-    from rna_motif_visualizer.database.base_provider import MotifInstance, ResidueSpec
+    CacheManager = _get("cache_manager").CacheManager
+    MotifInstance = _get("base_provider").MotifInstance
+    ResidueSpec = _get("base_provider").ResidueSpec
+    
+    cm = CacheManager(tmpdir, expiry_days=30)
+    print(f"✓ Cache manager created: {cm.cache_dir}")
+    
+    # Create test motif data
+    test_residues = [
+        ResidueSpec(chain="A", residue_number=100, nucleotide="G"),
+        ResidueSpec(chain="A", residue_number=101, nucleotide="A"),
+    ]
+    test_instance = MotifInstance(
+        instance_id="HL_TEST_001",
+        motif_id="HL",
+        pdb_id="TEST",
+        residues=test_residues,
+        annotation="Test hairpin loop"
+    )
+    test_motifs = {"HL": [test_instance]}
+    
+    # Test caching
+    cm.cache_motifs("TEST", "bgsu_api", test_motifs)
+    print("✓ Motifs cached successfully")
+    
+    # Test retrieval
+    cached = cm.get_cached_motifs("TEST", "bgsu_api")
+    assert cached is not None, "Should retrieve cached motifs"
+    assert "HL" in cached, "Should have HL motif type"
+    assert len(cached["HL"]) == 1, "Should have 1 instance"
+    print(f"✓ Retrieved cached motifs: {len(cached)} type(s)")
+    
+    # Test non-existent
+    missing = cm.get_cached_motifs("NONEXISTENT", "bgsu_api")
+    assert missing is None, "Should return None for missing cache"
+    print("✓ Returns None for missing cache entries")
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cm = CacheManager(tmpdir, expiry_days=30)
-        print(f"✓ Cache manager created: {cm.cache_dir}")
-        
-        # Create test motif data
-        test_residues = [
-            ResidueSpec(chain="A", residue_number=100, nucleotide="G"),
-            ResidueSpec(chain="A", residue_number=101, nucleotide="A"),
-        ]
-        test_instance = MotifInstance(
-            instance_id="HL_TEST_001",
-            motif_id="HL",
-            pdb_id="TEST",
-            residues=test_residues,
-            annotation="Test hairpin loop"
-        )
-        test_motifs = {"HL": [test_instance]}
-        
-        # Test caching
-        cm.cache_motifs("TEST", "bgsu_api", test_motifs)
-        print("✓ Motifs cached successfully")
-        
-        # Test retrieval
-        cached = cm.get_cached_motifs("TEST", "bgsu_api")
-        assert cached is not None, "Should retrieve cached motifs"
-        assert "HL" in cached, "Should have HL motif type"
-        assert len(cached["HL"]) == 1, "Should have 1 instance"
-        print(f"✓ Retrieved cached motifs: {len(cached)} type(s)")
-        
-        # Test non-existent
-        missing = cm.get_cached_motifs("NONEXISTENT", "bgsu_api")
-        assert missing is None, "Should return None for missing cache"
-        print("✓ Returns None for missing cache entries")
-        
     return True
 
 
@@ -139,8 +154,8 @@ def test_providers():
     print("TEST 4: API providers")
     print("=" * 60)
     
-    from rna_motif_visualizer.database.bgsu_api_provider import BGSUAPIProvider
-    from rna_motif_visualizer.database.rfam_api_provider import RfamAPIProvider
+    BGSUAPIProvider = _get("bgsu_api_provider").BGSUAPIProvider
+    RfamAPIProvider = _get("rfam_api_provider").RfamAPIProvider
     
     # Test BGSU provider
     bgsu = BGSUAPIProvider()
@@ -165,7 +180,7 @@ def test_bgsu_api():
     print("TEST 5: BGSU API live request")
     print("=" * 60)
     
-    from rna_motif_visualizer.database.bgsu_api_provider import BGSUAPIProvider
+    BGSUAPIProvider = _get("bgsu_api_provider").BGSUAPIProvider
     
     bgsu = BGSUAPIProvider()
     
@@ -194,55 +209,306 @@ def test_bgsu_api():
         return False
 
 
-def test_source_selector():
-    """Test 6: Test source selector."""
+def test_source_selector(tmpdir):
+    """Test 6: Test source selector (in the shared temp directory)."""
     print("\n" + "=" * 60)
     print("TEST 6: Source selector")
     print("=" * 60)
     
-    from rna_motif_visualizer.database.source_selector import SourceSelector
-    from rna_motif_visualizer.database.bgsu_api_provider import BGSUAPIProvider
-    from rna_motif_visualizer.database.cache_manager import CacheManager
-    import tempfile
+    SourceSelector = _get("source_selector").SourceSelector
+    BGSUAPIProvider = _get("bgsu_api_provider").BGSUAPIProvider
+    CacheManager = _get("cache_manager").CacheManager
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cm = CacheManager(tmpdir)
-        bgsu = BGSUAPIProvider(cache_manager=cm)
+    cm = CacheManager(tmpdir)
+    bgsu = BGSUAPIProvider(cache_manager=cm)
+    
+    providers = {"bgsu_api": bgsu}
+    selector = SourceSelector(providers, cm)
+    
+    print(f"✓ Source selector created with {len(providers)} provider(s)")
+    print(f"  Available sources: {selector.get_available_sources()}")
+    
+    # Test source info
+    info = selector.get_source_info()
+    print(f"  Source info: {info}")
+    
+    return True
+
+
+class _LocalHTTPHandler(BaseHTTPRequestHandler):
+    """Fixed routes for test_http_client; records each request's client port."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            body = b"not found"
+            self.send_response(404)
+        else:
+            body = b"ok"
+            self.send_response(200)
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path == "/drop":
+            # Advertise keep-alive, then close the socket anyway
+            self.close_connection = True
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def test_http_client():
+    """Test 7: Test the keep-alive HTTP client against a local server."""
+    print("\n" + "=" * 60)
+    print("TEST 7: HTTP client")
+    print("=" * 60)
+    
+    http_client = _get("http_client")
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LocalHTTPHandler)
+    server.client_ports = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    
+    if http_client._proxy_for("http", "127.0.0.1") is not None:
+        server.shutdown()
+        server.server_close()
+        print("ℹ HTTP proxy configured for 127.0.0.1; skipping")
+        return None
+    
+    ports = server.client_ports
+    key = ("http", f"127.0.0.1:{server.server_port}", None)
+    
+    def idle_count():
+        return len(http_client._idle.get(key, []))
+    
+    try:
+        # Connection reuse across requests
+        assert http_client.fetch_url(f"{base}/ok") == (200, b"ok")
+        assert http_client.fetch_url(f"{base}/ok") == (200, b"ok")
+        assert ports[0] == ports[1], "Second request should reuse the connection"
+        assert idle_count() == 1, "Connection should be back in the pool"
+        print("✓ Keep-alive connection reused across requests")
         
-        providers = {"bgsu_api": bgsu}
-        selector = SourceSelector(providers, cm)
+        # Redirects are followed
+        assert http_client.fetch_url(f"{base}/redirect") == (200, b"ok")
+        print("✓ 302 redirect followed")
         
-        print(f"✓ Source selector created with {len(providers)} provider(s)")
-        print(f"  Available sources: {selector.get_available_sources()}")
+        # Error statuses raise HTTPError
+        try:
+            http_client.fetch_url(f"{base}/missing")
+            raise AssertionError("404 should raise HTTPError")
+        except urllib.error.HTTPError as e:
+            assert e.code == 404, f"Expected 404, got {e.code}"
+        print("✓ 404 raises HTTPError")
         
-        # Test source info
-        info = selector.get_source_info()
-        print(f"  Source info: {info}")
+        # Server closes a kept-alive socket: next request retries on a new one
+        assert http_client.fetch_url(f"{base}/drop") == (200, b"ok")
+        dropped_port = ports[-1]
+        assert http_client.fetch_url(f"{base}/ok") == (200, b"ok")
+        assert ports[-1] != dropped_port, "Retry should use a fresh connection"
+        print("✓ Stale keep-alive connection retried on a fresh socket")
+        
+        # Connection: close responses are not returned to the pool
+        before = idle_count()
+        assert http_client.fetch_url(f"{base}/close") == (200, b"ok")
+        assert idle_count() == before - 1, "Closed connection should not be pooled"
+        print("✓ Connection: close response not kept in the pool")
+    finally:
+        server.shutdown()
+        server.server_close()
+        for conn in http_client._idle.pop(key, []):
+            conn.close()
+    
+    return True
+
+
+class _StubProvider:
+    """Provider stand-in whose lookups block until `release` is set."""
+    
+    def __init__(self, release=None):
+        self.release = release
+        self.calls = 0
+    
+    def get_motifs_for_pdb(self, pdb_id):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(10)
+        return {"STUB": []}
+
+
+def test_source_timeout():
+    """Test 8: Test the ALL-mode time budget with deliberately slow providers."""
+    print("\n" + "=" * 60)
+    print("TEST 8: All-sources timeout")
+    print("=" * 60)
+    
+    source_selector = _get("source_selector")
+    config = _get("config").get_config()
+    
+    # Enough slow providers to occupy every worker, plus one left queued
+    release = threading.Event()
+    slow = {
+        f"slow{i}": _StubProvider(release)
+        for i in range(source_selector.MAX_SOURCE_WORKERS + 1)
+    }
+    queued = slow[f"slow{source_selector.MAX_SOURCE_WORKERS}"]
+    fast = _StubProvider()
+    selector = source_selector.SourceSelector(dict(slow, fast=fast), cache_manager=object())
+    
+    saved_timeout = config.all_sources_timeout
+    config.all_sources_timeout = 0.2
+    try:
+        combined, sources = selector._get_from_all_sources("TEST", list(slow) + ["fast"])
+        assert sources == "", f"Slow providers should time out, got {sources!r}"
+        assert combined == {}, "No results expected when every source times out"
+        print("✓ Slow providers dropped after the time budget")
         
+        # Freed workers serve the next batch; the queued lookup never ran
+        release.set()
+        combined, sources = selector._get_from_all_sources("TEST", ["fast"])
+        assert sources == "fast", f"Expected fast source, got {sources!r}"
+        assert "fast:STUB" in combined
+        assert queued.calls == 0, "Queued lookup should be cancelled on timeout"
+        print("✓ Queued lookups cancelled; workers available to the next load")
+    finally:
+        config.all_sources_timeout = saved_timeout
+        release.set()
+    
     return True
 
 
-def main():
-    """Run all tests."""
+class _ThreadOutput:
+    """sys.stdout stand-in that sends each worker thread's prints to its own buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+def _run_buffered(test_fn, output):
+    """Run one test with its output captured; returns (result, output text, exception)."""
+    output._local.buffer = io.StringIO()
+    result, error = None, None
+    try:
+        result = test_fn()
+    except Exception as e:
+        error = e
+    finally:
+        text = output._local.buffer.getvalue()
+        output._local.buffer = None
+    return result, text, error
+
+
+# CLI name -> (display name, test function)
+TESTS = {
+    "imports": ("Imports", test_imports),
+    "config": ("Config", test_config),
+    "cache": ("Cache Manager", test_cache_manager),
+    "providers": ("Providers", test_providers),
+    "selector": ("Source Selector", test_source_selector),
+    "http": ("HTTP Client", test_http_client),
+    "timeout": ("All-Sources Timeout", test_source_timeout),
+    "bgsu": ("BGSU API Live", test_bgsu_api),  # optional (requires network)
+}
+
+# Tests run one at a time, in this order, before the concurrent ones
+SERIAL_TESTS = ("imports", "config")
+
+# Tests that take the shared temporary cache directory as their argument
+TMPDIR_TESTS = {"cache", "selector"}
+
+# RAM-backed temp location when available (avoids disk I/O for cache files)
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def parse_args(argv=None):
+    """Parse the names of the tests to run (default: all)."""
+    parser = argparse.ArgumentParser(description="RNA Motif Visualizer API provider tests")
+    parser.add_argument(
+        "tests", nargs="*", metavar="TEST",
+        help=f"tests to run (any of: {', '.join(TESTS)}; default: all)"
+    )
+    args = parser.parse_args(argv)
+    
+    unknown = [name for name in args.tests if name not in TESTS]
+    if unknown:
+        parser.error(f"unknown test(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    """Run the selected tests (all by default)."""
+    selected = parse_args(argv).tests or list(TESTS)
+    
     print("\n" + "=" * 60)
     print("RNA MOTIF VISUALIZER - API PROVIDER TESTS")
     print("=" * 60 + "\n")
     
     results = []
     
-    # Run tests
-    results.append(("Imports", test_imports()))
-    results.append(("Config", test_config()))
-    results.append(("Cache Manager", test_cache_manager()))
-    results.append(("Providers", test_providers()))
-    results.append(("Source Selector", test_source_selector()))
+    # Imports run first so worker threads don't race on first-time imports;
+    # config runs before the pool too, since it mutates the global config
+    # that the other tests read.
+    for key in SERIAL_TESTS:
+        if key in selected:
+            name, fn = TESTS[key]
+            results.append((name, fn()))
     
-    # API test is optional (requires network)
-    try:
-        results.append(("BGSU API Live", test_bgsu_api()))
-    except Exception as e:
-        print(f"\n⚠ BGSU API test skipped: {e}")
-        results.append(("BGSU API Live", None))
+    # The remaining tests are independent; run them concurrently so the
+    # network-bound BGSU request overlaps the local tests. Output is
+    # buffered per test and printed in order afterwards. Each test imports
+    # only the modules it needs, so a single selected test stays cheap.
+    tests = [key for key in TESTS if key not in SERIAL_TESTS and key in selected]
+    
+    outcomes = []
+    if tests:
+        # Worker threads must not race on the package's first import
+        importlib.import_module("rna_motif_visualizer.database")
+        
+        real_stdout = sys.stdout
+        output = _ThreadOutput(real_stdout)
+        sys.stdout = output
+        try:
+            # One temp directory shared by the cache-backed tests
+            with tempfile.TemporaryDirectory(dir=_SHM_DIR) as tmpdir, \
+                    ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = []
+                for key in tests:
+                    name, fn = TESTS[key]
+                    if key in TMPDIR_TESTS:
+                        fn = partial(fn, tmpdir)
+                    futures.append((name, executor.submit(_run_buffered, fn, output)))
+                outcomes = [(name, future.result()) for name, future in futures]
+        finally:
+            sys.stdout = real_stdout
+    
+    for name, (result, text, error) in outcomes:
+        sys.stdout.write(text)
+        if error is None:
+            results.append((name, result))
+        elif name == "BGSU API Live":
+            print(f"\n⚠ BGSU API test skipped: {error}")
+            results.append((name, None))
+        else:
+            raise error
     
     # Summary
     print("\n" + "=" * 60)
@@ -6,14 +6,26 @@ Runs without PyMOL to verify registry loading, indexing, and PDB lookups.
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Add the repo root to sys.path so we can import the package
 repo_root = Path(__file__).parent
 sys.path.insert(0, str(repo_root))
 
 plugin_path = repo_root / "rna_motif_visualizer"
 
+
+def count_by_type(motifs):
+    """Count motif entries per motif_type."""
+    return Counter(m.get('motif_type') for m in motifs)
+
 def test_motif_registry():
     """Test that motif registry loads correctly"""
     print("="*70)
@@ -27,8 +39,8 @@ def test_motif_registry():
         return False
     
     try:
-        with open(registry_file, 'r') as f:
-            registry = json.load(f)
+        with open(registry_file, 'rb') as f:
+            registry = _loads(f.read())
         
         atlas_count = len(registry.get("motif_files", {}))
         
@@ -128,12 +140,7 @@ def test_pdb_lookup():
                 continue
             
             # Group by type
-            by_type = {}
-            for m in motifs:
-                mtype = m.get('motif_type')
-                if mtype not in by_type:
-                    by_type[mtype] = 0
-                by_type[mtype] += 1
+            by_type = count_by_type(motifs)
             
             print(f"\n✓ {pdb_id}:")
             print(f"  Total motifs: {len(motifs)}")
@@ -176,9 +183,10 @@ def test_pdb_mapper():
             
             motif_count = mapper.count_motifs(test_pdb)
             summary = mapper.get_summary(test_pdb)
+            by_type = count_by_type(mapper.loader.get_motifs_for_pdb(test_pdb))
             
             print(f"\n✓ Testing with {test_pdb}:")
-            print(f"  {motif_count} total motifs")
+            print(f"  {motif_count} total motifs in {len(by_type)} motif types")
             print(f"\n{summary}")
         
         return True
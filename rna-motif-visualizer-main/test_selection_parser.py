@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+"""
+Test script for the selection-string helpers in utils/parser.py.
+Runs without PyMOL to check residue-range collapsing, multi-chain
+selections, the MotifSoA flattening and the memoized selection cache.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the repo root to sys.path so we can import the package
+repo_root = Path(__file__).parent
+sys.path.insert(0, str(repo_root))
+
+plugin_path = repo_root / "rna_motif_visualizer"
+
+
+class _StubCmd:
+    """Minimal PyMOL cmd stand-in: every command is accepted and ignored."""
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def check(label, actual, expected):
+    """Print one comparison; returns True if actual == expected."""
+    if actual == expected:
+        print(f"✓ {label}")
+        return True
+    print(f"❌ {label}: expected {expected!r}, got {actual!r}")
+    return False
+
+
+def test_residue_runs():
+    """Test run detection and compact resi rendering"""
+    print("="*70)
+    print("TEST 1: residue_runs / _collapse_ranges")
+    print("="*70)
+    
+    from rna_motif_visualizer.utils.parser import residue_runs, _collapse_ranges
+    
+    results = [
+        check("Empty input", residue_runs([]), []),
+        check("Single residue", residue_runs([7]), [(7, 7)]),
+        check("Unsorted input", residue_runs([12, 10, 11, 3]), [(3, 3), (10, 12)]),
+        check("Duplicates", residue_runs([5, 5, 6, 6, 8]), [(5, 6), (8, 8)]),
+        check("Negative resi", residue_runs([-2, 0, -1, 4]), [(-2, 0), (4, 4)]),
+        check("Collapse empty", _collapse_ranges([]), ""),
+        check("Collapse single", _collapse_ranges([42]), "42"),
+        check("Collapse unsorted/duplicates", _collapse_ranges([12, 1, 3, 2, 2, 8, 10, 11]),
+              "1-3+8+10-12"),
+        check("Collapse negative", _collapse_ranges([-3, -2, -1, 1]), "\\-3-\\-1+1"),
+        check("Collapse run through zero", _collapse_ranges([-1, 0, 1]), "\\-1-1"),
+    ]
+    return all(results)
+
+
+def test_selection_strings():
+    """Test single- and multi-chain selection strings"""
+    print("\n" + "="*70)
+    print("TEST 2: Selection strings")
+    print("="*70)
+    
+    from rna_motif_visualizer.utils.parser import SelectionParser, cached_selection_string
+    
+    multi = SelectionParser.create_multichain_selection({'A': [3, 1, 2], 'B': [9]})
+    single = SelectionParser.create_multichain_selection({'A': [5, 6]})
+    
+    results = [
+        check("Empty residues", SelectionParser.create_selection_string('A', []), None),
+        check("Single residue", SelectionParser.create_selection_string('A', [5]),
+              "chain A and resi 5"),
+        check("Negative residues", SelectionParser.create_selection_string('A', [-1, -2]),
+              "chain A and resi \\-2-\\-1"),
+        check("Multi-chain output", multi, "(chain A and resi 1-3) or (chain B and resi 9)"),
+        # Callers wrap the result once, so a single chain must not be pre-wrapped
+        check("Single-chain output is not parenthesised", single, "chain A and resi 5-6"),
+        check("No chains", SelectionParser.create_multichain_selection({}), None),
+        check("Chains without residues",
+              SelectionParser.create_multichain_selection({'A': [], 'B': []}), None),
+        check("Empty chain skipped",
+              SelectionParser.create_multichain_selection({'A': [], 'B': [4]}),
+              "chain B and resi 4"),
+        check("Cached matches uncached", cached_selection_string('C', (8, 7, 7)),
+              SelectionParser.create_selection_string('C', [7, 8])),
+    ]
+    return all(results)
+
+
+def test_motif_soa():
+    """Test MotifSoA flattening and per-chain merge"""
+    print("\n" + "="*70)
+    print("TEST 3: MotifSoA")
+    print("="*70)
+    
+    from rna_motif_visualizer.utils.parser import MotifSoA
+    
+    invalid = []
+    soa = MotifSoA.from_motif_list([
+        {'chain': 'A', 'residues': [3, 1, 2], 'motif_id': 'm1'},
+        {'chain': 'B', 'residues': [-1], 'motif_id': 'm2'},
+        {'chain': 'A', 'residues': [2, 9], 'motif_id': 'm3'},
+        {'chain': 'A', 'residues': [], 'motif_id': 'empty'},
+    ], invalid.append)
+    empty = MotifSoA.from_motif_list([])
+    
+    results = [
+        check("Entry count", len(soa), 3),
+        check("Invalid entry reported", [m['motif_id'] for m in invalid], ['empty']),
+        check("Motif IDs kept in order", soa.motif_ids, ['m1', 'm2', 'm3']),
+        check("Merged per chain (sorted, deduplicated)", soa.chain_residues(),
+              {'A': [1, 2, 3, 9], 'B': [-1]}),
+        check("Empty input", (len(empty), empty.chain_residues()), (0, {})),
+    ]
+    return all(results)
+
+
+def test_selection_cache_cleared():
+    """Test that clearing motifs or deleting an object drops cached selections"""
+    print("\n" + "="*70)
+    print("TEST 4: Selection cache invalidation")
+    print("="*70)
+    
+    from rna_motif_visualizer.utils.parser import cached_selection_string
+    from rna_motif_visualizer.utils.selectors import MotifSelector
+    from rna_motif_visualizer.loader import UnifiedMotifLoader
+    
+    cmd = _StubCmd()
+    
+    cached_selection_string('A', (1, 2, 3))
+    MotifSelector(cmd).delete_object('KTURN_ALL')
+    after_delete = cached_selection_string.cache_info().currsize
+    
+    cached_selection_string('A', (1, 2, 3))
+    UnifiedMotifLoader(cmd, str(plugin_path / "motif_database")).clear_motifs()
+    after_clear = cached_selection_string.cache_info().currsize
+    
+    results = [
+        check("delete_object clears the cache", after_delete, 0),
+        check("clear_motifs clears the cache", after_clear, 0),
+    ]
+    return all(results)
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*70)
+    print("SELECTION PARSER - TEST SUITE")
+    print("="*70 + "\n")
+    
+    tests = [
+        ("Residue Runs", test_residue_runs),
+        ("Selection Strings", test_selection_strings),
+        ("MotifSoA", test_motif_soa),
+        ("Selection Cache", test_selection_cache_cleared),
+    ]
+    
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"\n❌ FATAL ERROR in {test_name}: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_name, False))
+    
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✓ PASS" if result else "❌ FAIL"
+        print(f"{status:10s} - {test_name}")
+    
+    print(f"\nTotal: {passed}/{total} tests passed")
+    
+    if passed == total:
+        print("\n✓ All tests passed!")
+        return 0
+    else:
+        print(f"\n❌ {total - passed} test(s) failed. Check errors above.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
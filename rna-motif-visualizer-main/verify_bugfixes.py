@@ -4,22 +4,101 @@ Quick verification script to check if all bug fixes are in place.
 Run this to verify the session's fixes were applied correctly.
 """
 
+import mmap
 import os
 import sys
 
-def check_file_contains(filepath, search_string, description):
-    """Check if file contains a specific string."""
+try:
+    import ahocorasick  # optional: single-pass multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
+# (section title, file, [(literal that must appear, description), ...])
+CHECKS = [
+    ("Issue #2: Misleading Usage Message Fix", "gui.py", [
+        ('Use: rmv_fetch <PDB_ID>',
+         "Usage message corrected to 'rmv_fetch <PDB_ID>' (without tool suffix)"),
+        ('Example: rmv_fetch 1S72',
+         "Example updated to show single PDB_ID parameter"),
+    ]),
+    ("Issue #3: Visualization Fix - show_motif_type()", "loader.py", [
+        ('Color instances in chunks to avoid PyMOL selection string length limits',
+         "Chunked coloring implemented in show_motif_type()"),
+        ('for detail in motif_details:',
+         "Detail-by-detail iteration in show_motif_type()"),
+        ('if len(big_sel) > MAX_SELECTION_LENGTH and chunk_size > 1:',
+         "Chunk size halved when a combined selection is too long"),
+    ]),
+    ("Issue #3: Visualization Fix - show_all_motifs()", "loader.py", [
+        ('merged.setdefault(chain, set()).update(resi_list)',
+         "Instance residues merged per chain in show_all_motifs()"),
+        ('self._color_selections_chunked(structure_name, chain_sels, motif_type,\n'
+         '                                               show_cartoon=True)',
+         "Per-chain selections colored through the length-guarded chunked path"),
+    ]),
+]
+
+# Memory-mapped checked files (opened once, closed at the end of verify_fixes)
+_file_mmaps = {}
+
+# Decoded source text of each checked file, built once from its mmap
+_source_cache = {}
+
+def map_file(filepath):
+    """Memory-map a file read-only, once."""
+    if filepath not in _file_mmaps:
+        with open(filepath, 'rb') as f:
+            _file_mmaps[filepath] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _file_mmaps[filepath]
+
+def close_mapped_files():
+    """Close every mmap opened by map_file."""
+    for mm in _file_mmaps.values():
+        mm.close()
+    _file_mmaps.clear()
+
+def read_source(filepath):
+    """Return a file's (cached) source text."""
+    if filepath not in _source_cache:
+        _source_cache[filepath] = map_file(filepath)[:].decode('utf-8')
+    return _source_cache[filepath]
+
+def find_patterns(filepath, patterns):
+    """
+    Return the subset of literal patterns that occur in a file.
+    
+    With pyahocorasick installed, all patterns are matched in a single
+    pass over the source; otherwise each pattern is searched directly in
+    the file's mmap.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return {pattern for _, pattern in automaton.iter(read_source(filepath))}
+    
+    mm = map_file(filepath)
+    return {pattern for pattern in patterns if mm.find(pattern.encode('utf-8')) != -1}
+
+def report_checks(found, checks):
+    """Print and return pass/fail for each (pattern, description) check."""
+    results = []
+    for pattern, description in checks:
+        ok = pattern in found
+        print(f"{'✓' if ok else '✗'} {description}")
+        results.append(ok)
+    return results
+
+def check_compiles(filepath):
+    """Compile a file's cached source in memory (no .pyc written)."""
+    name = os.path.basename(filepath)
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-            if search_string in content:
-                print(f"✓ {description}")
-                return True
-            else:
-                print(f"✗ {description}")
-                return False
+        compile(read_source(filepath), filepath, 'exec')
+        print(f"✓ {name} compiles successfully")
+        return True
     except Exception as e:
-        print(f"✗ Could not check {description}: {e}")
+        print(f"✗ {name} has syntax errors: {e}")
         return False
 
 def verify_fixes():
@@ -35,75 +114,31 @@ def verify_fixes():
     
     results = []
     
-    # Issue #2: Usage message fix
-    print("Issue #2: Misleading Usage Message Fix")
-    print("-" * 70)
-    results.append(check_file_contains(
-        gui_file,
-        'Use: rmv_fetch <PDB_ID>',
-        "Usage message corrected to 'rmv_fetch <PDB_ID>' (without tool suffix)"
-    ))
-    results.append(check_file_contains(
-        gui_file,
-        'Example: rmv_fetch 1S72',
-        "Example updated to show single PDB_ID parameter"
-    ))
-    print()
+    files = {"gui.py": gui_file, "loader.py": loader_file}
     
-    # Issue #3: Visualization fix - show_motif_type
-    print("Issue #3: Visualization Fix - show_motif_type()")
-    print("-" * 70)
-    results.append(check_file_contains(
-        loader_file,
-        'Color each instance individually to avoid PyMOL selection string length limits',
-        "Loop-based coloring implemented in show_motif_type()"
-    ))
-    results.append(check_file_contains(
-        loader_file,
-        'for detail in motif_details:',
-        "Detail-by-detail iteration in show_motif_type()"
-    ))
-    results.append(check_file_contains(
-        loader_file,
-        'colors.set_motif_color_in_pymol(self.cmd, instance_sel, motif_type)',
-        "Individual instance coloring in show_motif_type()"
-    ))
-    print()
+    # One scan per file for every pattern checked against it
+    patterns_by_file = {}
+    for _, filename, checks in CHECKS:
+        patterns_by_file.setdefault(filename, set()).update(p for p, _ in checks)
+    found_by_file = {}
+    for filename, patterns in patterns_by_file.items():
+        try:
+            found_by_file[filename] = find_patterns(files[filename], patterns)
+        except Exception as e:
+            print(f"✗ Could not check {filename}: {e}")
+            found_by_file[filename] = set()
     
-    # Issue #3: Visualization fix - show_all_motifs
-    print("Issue #3: Visualization Fix - show_all_motifs()")
-    print("-" * 70)
-    results.append(check_file_contains(
-        loader_file,
-        'for motif_type, info in loaded_motifs.items():',
-        "Motif type iteration in show_all_motifs()"
-    ))
-    results.append(check_file_contains(
-        loader_file,
-        'for detail in motif_details:',
-        "Detail-by-detail iteration in show_all_motifs()"
-    ))
-    print()
+    for title, filename, checks in CHECKS:
+        print(title)
+        print("-" * 70)
+        results.extend(report_checks(found_by_file[filename], checks))
+        print()
     
     # Compilation check
     print("Syntax Validation")
     print("-" * 70)
-    try:
-        import py_compile
-        py_compile.compile(gui_file, doraise=True)
-        print("✓ gui.py compiles successfully")
-        results.append(True)
-    except Exception as e:
-        print(f"✗ gui.py has syntax errors: {e}")
-        results.append(False)
-    
-    try:
-        py_compile.compile(loader_file, doraise=True)
-        print("✓ loader.py compiles successfully")
-        results.append(True)
-    except Exception as e:
-        print(f"✗ loader.py has syntax errors: {e}")
-        results.append(False)
+    results.append(check_compiles(gui_file))
+    results.append(check_compiles(loader_file))
     
     print()
     print("=" * 70)
@@ -119,4 +154,7 @@ def verify_fixes():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(verify_fixes())
+    try:
+        sys.exit(verify_fixes())
+    finally:
+        close_mapped_files()